@@ -41,10 +41,8 @@ from xsdba.processing import stack_variables, unstack_variables
 # TODO: ISIMIP ? Used for precip freq adjustment in biasCorrection.R
 # Hempel, S., Frieler, K., Warszawski, L., Schewe, J., & Piontek, F. (2013). A trend-preserving bias correction &ndash;
 # The ISI-MIP approach. Earth System Dynamics, 4(2), 219–236. https://doi.org/10.5194/esd-4-219-2013
-# If SBCK is installed, create adjustment classes wrapping SBCK's algorithms.
-if hasattr(adjustment, "_generate_SBCK_classes"):
-    for cls in adjustment._generate_SBCK_classes():
-        adjustment.__dict__[cls.__name__] = cls
+# If SBCK is installed, adjustment classes wrapping SBCK's algorithms are generated on first access
+# to one of the `xsdba.adjustment.SBCK_*` attributes.
 
 __author__ = """Éric Dupuis"""
 __email__ = "dupuis.eric@ouranos.ca"
@@ -381,10 +381,12 @@ def mbcn_train(
     af_q_l = []
     escores_l = []
 
+    # time indexes of all blocks, with -1 for missing entries, converted once for all blocks
+    gw_table = gw_idxs.fillna(-1).astype(int).transpose(gr_dim, ...).values
+
     # loop over time blocks
-    for ib in range(gw_idxs[gr_dim].size):
+    for ib, indices in enumerate(gw_table):
         # indices in a given time block
-        indices = gw_idxs[{gr_dim: ib}].fillna(-1).astype(int).values
         ind = indices[indices >= 0]
 
         # npdft training : multiple rotations on standardized datasets
@@ -542,11 +544,12 @@ def mbcn_adjust(
 
     # mbcn core
     scen_mbcn = xr.zeros_like(sim)
-    for ib in range(gw_idxs[gr_dim].size):
+    # time indexes of all blocks, with -1 for missing entries, converted once for all blocks
+    gw_table = gw_idxs.fillna(-1).astype(int).transpose(gr_dim, ...).values
+    g_table = g_idxs.fillna(-1).astype(int).transpose(gr_dim, ...).values
+    for ib, (indices_gw, indices_g) in enumerate(zip(gw_table, g_table, strict=True)):
         # indices in a given time block (with and without the window)
-        indices_gw = gw_idxs[{gr_dim: ib}].fillna(-1).astype(int).values
         ind_gw = indices_gw[indices_gw >= 0]
-        indices_g = g_idxs[{gr_dim: ib}].fillna(-1).astype(int).values
         ind_g = indices_g[indices_g >= 0]
 
         # 1. univariate adjustment of sim -> scen
@@ -13,8 +13,8 @@ import numpy as np
 import xarray as xr
 
 from xsdba import nbutils as nbu
-from xsdba.base import Grouper, map_groups
-from xsdba.utils import ADDITIVE, apply_correction, ecdf, invert, rank
+from xsdba.base import Grouper, map_blocks, map_groups
+from xsdba.utils import ADDITIVE, apply_correction, broadcast, ecdf, invert, rank
 
 
 @map_groups(
@@ -114,12 +114,14 @@ def _adapt_freq(
         too_small_too_big_or_null = (rnk < (P0_ref / P0_hist) * P0_sim) | (rnk > P0_sim) | sim.isnull()
         # ensure we have the same order of dims for the .shape call below
         too_small_too_big_or_null = too_small_too_big_or_null.transpose(*sim.dims, ...)
+        # The generator is seeded from numpy's global state so that `np.random.seed` still applies.
+        rng = np.random.default_rng(np.random.randint(2**32, dtype=np.uint32))
         sim_ad = sim.where(
             no_adaptation_needed,
             sim.where(
                 too_small_too_big_or_null,  # Preserve current values
                 # Generate random numbers ~ U[T0, Pth]
-                (pth.broadcast_like(sim) - thresh) * np.random.random_sample(size=too_small_too_big_or_null.shape).astype(sim.dtype) + thresh,
+                (pth.broadcast_like(sim) - thresh) * rng.random(size=too_small_too_big_or_null.shape).astype(sim.dtype) + thresh,
             ),
         )
 
@@ -142,11 +144,11 @@ def _adapt_freq(
     )
 
 
-@map_groups(reduces=[Grouper.DIM, Grouper.PROP], data=[Grouper.DIM], norm=[Grouper.PROP])
+@map_blocks(reduces=[Grouper.DIM, Grouper.PROP], data=[Grouper.DIM], norm=[Grouper.PROP])
 def _normalize(
     ds: xr.Dataset,
     *,
-    dim: Sequence[str],
+    group: Grouper,
     kind: str = ADDITIVE,
 ) -> xr.Dataset:
     """
@@ -159,8 +161,6 @@ def _normalize(
         If a `norm` variable is present, is uses this one instead of computing the norm again.
     group : Union[str, Grouper]
         Grouping information. See :py:class:`xsdba.base.Grouper` for details.
-    dim : sequence of strings
-        Dimension name(s).
     kind : {'+', '*'}
         How to apply the adjustment, using either additive or multiplicative methods.
 
@@ -171,14 +171,16 @@ def _normalize(
 
     Notes
     -----
-    Normalization is performed group-wise.
+    Normalization is performed group-wise. The means of all groups are computed in a single grouped reduction
+    and are then broadcast back along the main dimension.
     """
     if "norm" in ds:
         norm = ds.norm
     else:
-        norm = ds.data.mean(dim=dim)
-    out = xr.Dataset({"data": apply_correction(ds.data, invert(norm, kind), kind), "norm": norm.assign_attrs(_group_apply_reshape=True)})
-    return out
+        # Only keep the reduced variable, not the attributes added by `group.apply`.
+        norm = group.apply("mean", {"norm": ds.data}).norm
+    data = apply_correction(ds.data, broadcast(invert(norm, kind), ds.data, group=group), kind)
+    return xr.Dataset({"data": data, "norm": norm})
 
 
 @map_groups(reordered=[Grouper.DIM], main_only=False)
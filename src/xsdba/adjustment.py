@@ -4,6 +4,7 @@ Adjustment Methods
 """
 
 from __future__ import annotations
+from collections.abc import Iterable
 from copy import deepcopy
 from importlib.util import find_spec
 from inspect import signature
@@ -65,6 +66,13 @@ __all__ = [
 ]
 
 
+def _as_per_var_dict(x: dict | str | None, variables: Iterable[str]) -> dict:
+    """Return a new mapping from variable name to value, the same value being used for all variables if `x` is a string."""
+    if isinstance(x, str):
+        return {v: x for v in variables}
+    return {} if x is None else dict(x)
+
+
 class BaseAdjustment(ParametrizableWithDataset):
     """
     Base class for adjustment objects.
@@ -1522,9 +1530,7 @@ class OTC(Adjust):
         if "_is_hist" not in sim.attrs:
             raise ValueError("OTC does not take a `sim` argument.")
 
-        if isinstance(adapt_freq_thresh, str):
-            adapt_freq_thresh = {v: adapt_freq_thresh for v in hist[pts_dim].values}
-        adapt_freq_thresh = {} if adapt_freq_thresh is None else deepcopy(adapt_freq_thresh)
+        adapt_freq_thresh = _as_per_var_dict(adapt_freq_thresh, hist[pts_dim].values)
         if adapt_freq_thresh != {}:
             _, units = cls._harmonize_units(sim)
             for var, thresh in adapt_freq_thresh.items():
@@ -1671,8 +1677,8 @@ class dOTC(Adjust):
         if find_spec("ot") is None:
             raise ImportError("POT is required for OTC and dOTC. Please install with `pip install POT`.")
 
-        if isinstance(kind, str):
-            kind = {v: kind for v in hist[pts_dim].values}
+        if kind is not None:
+            kind = _as_per_var_dict(kind, hist[pts_dim].values)
         if kind is not None and "*" in kind.values() and cov_factor == "cholesky":
             raise ValueError("Multiplicative correction is not supported with `cov_factor` = 'cholesky'.")
 
@@ -1682,16 +1688,21 @@ class dOTC(Adjust):
         if normalization not in ["standardize", "max_distance", "max_value"] and normalization is not None:
             raise ValueError("`normalization` should be in ['standardize', 'max_distance', 'max_value'] or None.")
 
-        if isinstance(adapt_freq_thresh, str):
-            adapt_freq_thresh = {v: adapt_freq_thresh for v in hist[pts_dim].values}
-        adapt_freq_thresh = {} if adapt_freq_thresh is None else deepcopy(adapt_freq_thresh)
+        adapt_freq_thresh = _as_per_var_dict(adapt_freq_thresh, hist[pts_dim].values)
         if adapt_freq_thresh != {}:
             _, units = cls._harmonize_units(sim)
             for var, thresh in adapt_freq_thresh.items():
                 adapt_freq_thresh[var] = str(convert_units_to(thresh, units[var]))
 
+        # `sim` was given the time coordinate of `ref` in `adjust`, so the inputs are already aligned.
+        # Passing the underlying variables with explicit coords skips the alignment and merge of a
+        # regular Dataset construction.
+        ds = xr.Dataset(
+            data_vars={"ref": ref.variable, "hist": hist.variable, "sim": sim.variable},
+            coords=ref.coords,
+        )
         scen = dotc_adjust(
-            xr.Dataset({"ref": ref, "hist": hist, "sim": sim}),
+            ds,
             bin_width=bin_width,
             bin_origin=bin_origin,
             num_iter_max=num_iter_max,
@@ -1973,104 +1984,125 @@ class MBCn(TrainAdjust):
         return out
 
 
-try:
-    import SBCK
-except ImportError:  # noqa: S110
-    # SBCK is not installed, we will not generate the SBCK classes.
-    pass
-else:
-
-    class _SBCKAdjust(Adjust):
-        sbck = None  # The method
-
-        @classmethod
-        def _adjust(cls, ref, hist, sim, *, multi_dim=None, **kwargs):
-            # Check inputs
-            fit_needs_sim = "X1" in signature(cls.sbck.fit).parameters
-            for k, v in signature(cls.sbck.__init__).parameters.items():
-                if v.default == v.empty and v.kind != v.VAR_KEYWORD and k != "self" and k not in kwargs:
-                    raise ValueError(f"Argument {k} is not optional for SBCK method {cls.sbck.__name__}.")
-
-            ref = ref.rename(time="time_cal")
-            hist = hist.rename(time="time_cal")
-            sim = sim.rename(time="time_tgt")
-
-            if multi_dim:
-                input_core_dims = [
-                    ("time_cal", multi_dim),
-                    ("time_cal", multi_dim),
-                    ("time_tgt", multi_dim),
-                ]
-            else:
-                input_core_dims = [("time_cal",), ("time_cal",), ("time_tgt",)]
-
-            return xr.apply_ufunc(
-                cls._apply_sbck,
-                ref,
-                hist,
-                sim,
-                input_core_dims=input_core_dims,
-                kwargs={"method": cls.sbck, "fit_needs_sim": fit_needs_sim, **kwargs},
-                vectorize=True,
-                keep_attrs=True,
-                dask="parallelized",
-                output_core_dims=[input_core_dims[-1]],
-                output_dtypes=[sim.dtype],
-            ).rename(time_tgt="time")
-
-        @staticmethod
-        def _apply_sbck(ref, hist, sim, method, fit_needs_sim, **kwargs):
-            obj = method(**kwargs)
-            if fit_needs_sim:
-                obj.fit(ref, hist, sim)
-            else:
-                obj.fit(ref, hist)
-            scen = obj.predict(sim)
-            if sim.ndim == 1:
-                return scen[:, 0]
-            return scen
-
-    def _parse_sbck_doc(cls):
-        def _parse(s):
-            s = s.replace("\t", "    ")
-            n = min(len(line) - len(line.lstrip()) for line in s.split("\n") if line)
-            lines = []
-            for line in s.split("\n"):
-                line = line[n:] if line else line
-                if set(line).issubset({"=", " "}):
-                    line = line.replace("=", "-")
-                elif set(line).issubset({"-", " "}):
-                    line = line.replace("-", "~")
-                lines.append(line)
-            return lines
-
-        return "\n".join(
-            [
-                f"SBCK_{cls.__name__}",
-                "=" * (5 + len(cls.__name__)),
-                (f"This Adjustment object was auto-generated from the {cls.__name__}  object of package SBCK. See :ref:`Experimental wrap of SBCK`."),
-                "",
-                (
-                    "The adjust method accepts ref, hist, sim and all arguments listed "
-                    'below in "Parameters". It also accepts a `multi_dim` argument '
-                    "specifying the dimension across which to take the 'features' and "
-                    "is valid for multivariate methods only. See :py:func:`xsdba.stack_variables`."
-                    "In the description below, `n_features` is the size of the `multi_dim` "
-                    "dimension. There is no way of specifying parameters across other "
-                    "dimensions for the moment."
-                ),
-                "",
-                *_parse(cls.__doc__),
-                *_parse(cls.__init__.__doc__),
-                " Copyright(c) 2021 Yoann Robin.",
+class _SBCKAdjust(Adjust):
+    sbck = None  # The method
+
+    @classmethod
+    def _adjust(cls, ref, hist, sim, *, multi_dim=None, **kwargs):
+        # Check inputs
+        fit_needs_sim = "X1" in signature(cls.sbck.fit).parameters
+        for k, v in signature(cls.sbck.__init__).parameters.items():
+            if v.default == v.empty and v.kind != v.VAR_KEYWORD and k != "self" and k not in kwargs:
+                raise ValueError(f"Argument {k} is not optional for SBCK method {cls.sbck.__name__}.")
+
+        ref = ref.rename(time="time_cal")
+        hist = hist.rename(time="time_cal")
+        sim = sim.rename(time="time_tgt")
+
+        if multi_dim:
+            input_core_dims = [
+                ("time_cal", multi_dim),
+                ("time_cal", multi_dim),
+                ("time_tgt", multi_dim),
             ]
-        )
+        else:
+            input_core_dims = [("time_cal",), ("time_cal",), ("time_tgt",)]
+
+        return xr.apply_ufunc(
+            cls._apply_sbck,
+            ref,
+            hist,
+            sim,
+            input_core_dims=input_core_dims,
+            kwargs={"method": cls.sbck, "fit_needs_sim": fit_needs_sim, **kwargs},
+            vectorize=True,
+            keep_attrs=True,
+            dask="parallelized",
+            output_core_dims=[input_core_dims[-1]],
+            output_dtypes=[sim.dtype],
+        ).rename(time_tgt="time")
+
+    @staticmethod
+    def _apply_sbck(ref, hist, sim, method, fit_needs_sim, **kwargs):
+        obj = method(**kwargs)
+        if fit_needs_sim:
+            obj.fit(ref, hist, sim)
+        else:
+            obj.fit(ref, hist)
+        scen = obj.predict(sim)
+        if sim.ndim == 1:
+            return scen[:, 0]
+        return scen
 
-    def _generate_SBCK_classes():  # noqa: N802
-        classes = []
-        for clsname in dir(SBCK):
-            cls = getattr(SBCK, clsname)
-            if not clsname.startswith("_") and isinstance(cls, type) and hasattr(cls, "fit") and hasattr(cls, "predict"):
-                doc = _parse_sbck_doc(cls)
-                classes.append(type(f"SBCK_{clsname}", (_SBCKAdjust,), {"sbck": cls, "__doc__": doc}))
-        return classes
+
+def _parse_sbck_doc(cls):
+    def _parse(s):
+        s = s.replace("\t", "    ")
+        n = min(len(line) - len(line.lstrip()) for line in s.split("\n") if line)
+        lines = []
+        for line in s.split("\n"):
+            line = line[n:] if line else line
+            if set(line).issubset({"=", " "}):
+                line = line.replace("=", "-")
+            elif set(line).issubset({"-", " "}):
+                line = line.replace("-", "~")
+            lines.append(line)
+        return lines
+
+    return "\n".join(
+        [
+            f"SBCK_{cls.__name__}",
+            "=" * (5 + len(cls.__name__)),
+            (f"This Adjustment object was auto-generated from the {cls.__name__}  object of package SBCK. See :ref:`Experimental wrap of SBCK`."),
+            "",
+            (
+                "The adjust method accepts ref, hist, sim and all arguments listed "
+                'below in "Parameters". It also accepts a `multi_dim` argument '
+                "specifying the dimension across which to take the 'features' and "
+                "is valid for multivariate methods only. See :py:func:`xsdba.stack_variables`."
+                "In the description below, `n_features` is the size of the `multi_dim` "
+                "dimension. There is no way of specifying parameters across other "
+                "dimensions for the moment."
+            ),
+            "",
+            *_parse(cls.__doc__),
+            *_parse(cls.__init__.__doc__),
+            " Copyright(c) 2021 Yoann Robin.",
+        ]
+    )
+
+
+def _generate_SBCK_classes():  # noqa: N802
+    import SBCK  # pylint: disable=import-outside-toplevel
+
+    classes = []
+    for clsname in dir(SBCK):
+        cls = getattr(SBCK, clsname)
+        if not clsname.startswith("_") and isinstance(cls, type) and hasattr(cls, "fit") and hasattr(cls, "predict"):
+            doc = _parse_sbck_doc(cls)
+            classes.append(type(f"SBCK_{clsname}", (_SBCKAdjust,), {"sbck": cls, "__doc__": doc}))
+    return classes
+
+
+# SBCK is imported on first access to one of the `SBCK_` classes, not when this module is imported.
+_sbck_classes: dict[str, type] | None = None
+
+
+def _get_SBCK_classes() -> dict[str, type]:  # noqa: N802
+    """Generate the SBCK wrapper classes once and register them in this module. Empty if SBCK is not installed."""
+    global _sbck_classes  # noqa: PLW0603
+    if _sbck_classes is None:
+        try:
+            _sbck_classes = {cls.__name__: cls for cls in _generate_SBCK_classes()}
+        except ImportError:
+            # SBCK is not installed, we will not generate the SBCK classes.
+            _sbck_classes = {}
+        globals().update(_sbck_classes)
+        __all__.extend(_sbck_classes)
+    return _sbck_classes
+
+
+def __getattr__(name: str) -> Any:
+    if name.startswith("SBCK_") and name in _get_SBCK_classes():
+        return _get_SBCK_classes()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1142,7 +1142,7 @@ def stack_periods(
     """
     # Import in function to avoid cyclical imports
     from xsdba.units import (  # pylint: disable=import-outside-toplevel
-        infer_sampling_units,
+        _freq_to_sampling_units,
         units2str,
     )
 
@@ -1237,7 +1237,8 @@ def stack_periods(
     )
     longest = lengths.max().item()
     # Length as a pint-ready array : with proper units, but values are not usable as indexes anymore
-    m, u = infer_sampling_units(da)
+    # The sampling frequency was already inferred above, same default as `infer_sampling_units`.
+    m, u = _freq_to_sampling_units(srcfreq or "D")
     lengths = lengths * m
     lengths.attrs["units"] = units2str(u)
     # Start points for each period and remember parameters for unstacking
@@ -4,13 +4,13 @@ Pre- and Post-Processing Submodule
 """
 
 from __future__ import annotations
-import types
 import warnings
 from collections.abc import Callable, Sequence
-from typing import cast
+from functools import lru_cache
 
 import dask.array as dsk
 import numpy as np
+import pandas as pd
 import xarray as xr
 from scipy.fft import dctn, idctn
 from xarray.core.utils import get_temp_dimname
@@ -177,6 +177,35 @@ def jitter_over_thresh(x: xr.DataArray, thresh: str, upper_bnd: str) -> xr.DataA
     return j
 
 
+def _uniform_noise(rng: np.random.Generator, low, high, size: int, dtype: np.dtype) -> np.ndarray:
+    """Draw `size` values uniformly distributed in [low, high[, directly in single precision for float32 data."""
+    if dtype == np.float32:
+        low, high = np.float32(low), np.float32(high)
+        return rng.random(size, dtype=np.float32) * (high - low) + low
+    return rng.uniform(low=low, high=high, size=size)
+
+
+def _jitter_array(arr: np.ndarray, rng: np.random.Generator, lower=None, minimum=None, upper=None, maximum=None) -> np.ndarray:
+    """Replace values under `lower` and over or equal to `upper` by uniform noise, only drawing noise for those values."""
+    out = arr.copy()
+    # Comparisons with NaN are False, missing values are never replaced.
+    # Nothing is drawn nor assigned if no value crosses a threshold.
+    if lower is not None:
+        hits = arr < lower
+        if nhits := np.count_nonzero(hits):
+            out[hits] = _uniform_noise(rng, minimum, lower, nhits, arr.dtype)
+    if upper is not None:
+        hits = arr >= upper
+        if nhits := np.count_nonzero(hits):
+            out[hits] = _uniform_noise(rng, upper, maximum, nhits, arr.dtype)
+    return out
+
+
+def _jitter_block(arr: np.ndarray, seed: int, block_id=None, **kwargs) -> np.ndarray:
+    """Apply `_jitter_array` on a dask block, with a generator seeded from `seed` and the block's position."""
+    return _jitter_array(arr, np.random.default_rng([seed, *block_id]), **kwargs)
+
+
 @update_xsdba_history
 @harmonize_units(["x", "lower", "upper", "minimum", "maximum"])
 def jitter(
@@ -216,42 +245,38 @@ def jitter(
     Warnings
     --------
     Not to be confused with R's `jitter`, which adds uniform noise instead of replacing values.
+
+    Notes
+    -----
+    The noise is drawn from a generator seeded from numpy's global random state, so results are reproducible
+    after a call to `np.random.seed`. With dask, each block draws its noise from its own generator, seeded from
+    that seed and the block's position. The noise thus depends on the chunking: the same data and seed chunked
+    differently give different noise.
     """
-    out: xr.DataArray = x
-    notnull = x.notnull()
+    # Bounds are numpy scalars rather than python floats so the comparisons are done in float64 even for float32 inputs.
+    jitter_kws = {}
     if lower is not None:
-        jitter_lower = np.array(lower).astype(float)
-        jitter_min = np.array(minimum if minimum is not None else 0).astype(float)
-        jitter_min = np.nextafter(jitter_min.astype(x.dtype), np.inf, dtype=x.dtype)
-        if uses_dask(x):
-            jitter_dist = dsk.random.uniform(
-                low=dsk.from_array(jitter_min),
-                high=dsk.from_array(jitter_lower),
-                size=x.shape,
-                chunks=x.chunks,
-            )
-        else:
-            jitter_dist = np.random.uniform(low=jitter_min, high=jitter_lower, size=x.shape)
-        out = out.where(~((x < jitter_lower) & notnull), jitter_dist.astype(x.dtype))
+        jitter_kws["lower"] = np.float64(lower)
+        jitter_min = np.float64(minimum if minimum is not None else 0)
+        jitter_kws["minimum"] = np.nextafter(x.dtype.type(jitter_min), np.inf, dtype=x.dtype)
     if upper is not None:
         if maximum is None:
             raise ValueError("If 'upper' is given, so must 'maximum'.")
-        jitter_upper = np.array(upper).astype(float)
-        jitter_max = np.array(maximum).astype(float)
-        # for float64 (dtype.itemsize==8), `np.random.uniform`
+        jitter_kws["upper"] = np.float64(upper)
+        jitter_max = np.float64(maximum)
+        # for float64 (dtype.itemsize==8), `Generator.uniform`
         # already excludes the upper limit
         if x.dtype.itemsize < 8:
-            jitter_max = np.nextafter(jitter_max.astype(x.dtype), -np.inf, dtype=x.dtype)
-        if uses_dask(x):
-            jitter_dist = dsk.random.uniform(
-                low=dsk.from_array(jitter_upper),
-                high=dsk.from_array(jitter_max),
-                size=x.shape,
-                chunks=x.chunks,
-            )
-        else:
-            jitter_dist = np.random.uniform(low=jitter_upper, high=jitter_max, size=x.shape)
-        out = out.where(~((x >= jitter_upper) & notnull), jitter_dist.astype(x.dtype))
+            jitter_max = np.nextafter(x.dtype.type(jitter_max), -np.inf, dtype=x.dtype)
+        jitter_kws["maximum"] = jitter_max
+
+    # Noise is drawn from numpy Generators, seeded from numpy's global state so that `np.random.seed` still applies.
+    seed = np.random.randint(2**32, dtype=np.uint32)
+    if uses_dask(x):
+        # Each block draws noise from its own generator.
+        out = x.copy(data=dsk.map_blocks(_jitter_block, x.data, seed, dtype=x.dtype, **jitter_kws))
+    else:
+        out = x.copy(data=_jitter_array(x.values, np.random.default_rng(seed), **jitter_kws))
 
     copy_all_attrs(out, x)  # copy attrs and same units
     return out
@@ -289,11 +314,7 @@ def normalize(
     norm : xr.DataArray
         Mean over each group.
     """
-    ds = xr.Dataset({"data": data})
-
-    if norm is not None:
-        ds = ds.assign(norm=norm)
-
+    ds = xr.Dataset({"data": data} if norm is None else {"data": data, "norm": norm})
     out = _normalize(ds, group=group, kind=kind)
     copy_all_attrs(out, ds)
     out.data.attrs.update(data.attrs)
@@ -307,17 +328,15 @@ def uniform_noise_like(da: xr.DataArray, low: float = 1e-6, high: float = 1e-3)
 
     Noise is uniformly distributed between low and high.
     Alternative method to `jitter_under_thresh` for avoiding zeroes.
+    The generator is seeded from numpy's global random state, so results are reproducible after `np.random.seed`.
     """
-    mod: types.ModuleType
-    kw: dict
+    seed = np.random.randint(2**32, dtype=np.uint32)
     if uses_dask(da):
-        mod = dsk
-        kw = {"chunks": da.chunks}
+        data = dsk.random.default_rng(seed).uniform(low, high, size=da.shape, chunks=da.chunks)
     else:
-        mod = np
-        kw = {}
+        data = np.random.default_rng(seed).uniform(low, high, size=da.shape)
 
-    return da.copy(data=(high - low) * mod.random.random_sample(size=da.shape, **kw) + low)
+    return da.copy(data=data)
 
 
 @update_xsdba_history
@@ -345,7 +364,17 @@ def standardize(
         mean = da.mean(dim, keep_attrs=True)
     if std is None:
         std = da.std(dim, keep_attrs=True)
-    out = (da - mean) / std
+    out = xr.apply_ufunc(
+        _standardize_array,
+        da,
+        mean,
+        std,
+        # Same alignment as the arithmetic operators
+        join="inner",
+        dataset_join="inner",
+        dask="parallelized",
+        output_dtypes=[_result_dtype(da, mean, std)],
+    )
     copy_all_attrs(out, da)
     return out, mean, std
 
@@ -353,11 +382,40 @@ def standardize(
 @update_xsdba_history
 def unstandardize(da: xr.DataArray, mean: xr.DataArray, std: xr.DataArray):
     """Rescale a standardized array by performing the inverse operation of `standardize`."""
-    out = (std * da) + mean
+    out = xr.apply_ufunc(
+        _unstandardize_array,
+        da,
+        mean,
+        std,
+        # Same alignment as the arithmetic operators
+        join="inner",
+        dataset_join="inner",
+        dask="parallelized",
+        output_dtypes=[_result_dtype(da, mean, std)],
+    )
     copy_all_attrs(out, da)
     return out
 
 
+def _result_dtype(*args) -> np.dtype:
+    """Dtype resulting from an arithmetic operation between DataArrays and scalars, without loading any data."""
+    return np.result_type(*(getattr(arg, "dtype", arg) for arg in args))
+
+
+def _standardize_array(arr: np.ndarray, mean: np.ndarray, std: np.ndarray) -> np.ndarray:
+    """Compute `(arr - mean) / std` in a single output buffer."""
+    out = np.empty(np.broadcast_shapes(*map(np.shape, (arr, mean, std))), dtype=np.result_type(arr, mean, std))
+    np.subtract(arr, mean, out=out)
+    return np.divide(out, std, out=out)
+
+
+def _unstandardize_array(arr: np.ndarray, mean: np.ndarray, std: np.ndarray) -> np.ndarray:
+    """Compute `std * arr + mean` in a single output buffer."""
+    out = np.empty(np.broadcast_shapes(*map(np.shape, (arr, mean, std))), dtype=np.result_type(arr, mean, std))
+    np.multiply(std, arr, out=out)
+    return np.add(out, mean, out=out)
+
+
 @update_xsdba_history
 def reordering(ref: xr.DataArray, sim: xr.DataArray, group: str = "time") -> xr.Dataset:
     """
@@ -417,7 +475,7 @@ def escore(
     scale : bool
         Whether to scale the data before computing the score. If True, both arrays as scaled according
         to the mean and standard deviation of `tgt` along `obs_dim`. (std computed with `ddof=1` and both
-        statistics excluding NaN values).
+        statistics excluding NaN values). If `N` is larger than 0, the statistics are computed on the subsampled `tgt`.
 
     Returns
     -------
@@ -461,7 +519,9 @@ def escore(
         tgt = tgt.isel({obs_dim: slice(None, None, tgt_step)})
 
     if scale:
-        tgt, avg, std = standardize(tgt)
+        avg = tgt.mean(obs_dim)
+        std = tgt.std(obs_dim, ddof=1)
+        tgt, _, _ = standardize(tgt, avg, std)
         sim, _, _ = standardize(sim, avg, std)
 
     # The dimension renaming is to allow different coordinates.
@@ -475,7 +535,6 @@ def escore(
         input_core_dims=[[pts_dim, obs_dim], [pts_dim, new_dim]],
         output_dtypes=[sim.dtype],
         dask="parallelized",
-        vectorize=True,
     )
 
     out.name = "escores"
@@ -489,6 +548,32 @@ def escore(
     return out
 
 
+def _check_within_bounds(arr: np.ndarray, lower: float, upper: float | None) -> np.ndarray:
+    """Return `arr` unchanged, raising an error if some of its values are outside [lower, upper]."""
+    if (arr < lower).any() or (upper is not None and (arr > upper).any()):
+        raise ValueError(
+            "The input dataset contains values outside of the range [lower_bound, upper_bound] "
+            "(with upper_bound given by infinity if it is not specified). Clipping the values to the range "
+            "]lower_bound, upper_bound[ is not allowed in this case. Check if the bounds are taken appropriately or "
+            "if your input dataset has unphysical values and you meant to use 'permissive' instead of 'strict'."
+        )
+    return arr
+
+
+def _to_additive_array(arr: np.ndarray, trans: str, lower: np.ndarray, upper: np.ndarray | None = None, clip: bool = False) -> np.ndarray:
+    """Transform `arr` to the additive space with as few temporary arrays as possible, see :py:func:`to_additive_space`."""
+    if clip:
+        arr = np.clip(arr, np.nextafter(lower, np.inf), None if upper is None else np.nextafter(upper, -np.inf))
+    out = np.subtract(arr, lower, dtype=np.result_type(arr, lower, 1.0))
+    with np.errstate(divide="ignore"):
+        if trans == "logit":
+            # X' / (1 - X') simplifies to (X - b-) / (b+ - X), which saves the normalization pass.
+            out /= upper - arr
+        if clip:
+            np.maximum(out, np.nextafter(out.dtype.type(0), np.inf, dtype=out.dtype), out=out)
+        return np.log(out, out=out)
+
+
 @update_xsdba_history
 @harmonize_units(["data", "lower_bound", "upper_bound"])
 def to_additive_space(
@@ -584,34 +669,23 @@ def to_additive_space(
         # check that inputs are valid
         if clip_next_to_bounds not in ["strict", "permissive"]:
             raise ValueError("`clip_next_to_bounds` must be one of {None, 'strict', 'permissive'}.")
-        if ((data < lower_bound).any() or (data > (upper_bound or np.nan)).any()) and clip_next_to_bounds != "permissive":
-            raise ValueError(
-                "The input dataset contains values outside of the range [lower_bound, upper_bound] "
-                "(with upper_bound given by infinity if it is not specified). Clipping the values to the range "
-                "]lower_bound, upper_bound[ is not allowed in this case. Check if the bounds are taken appropriately or "
-                "if your input dataset has unphysical values and you meant to use 'permissive' instead of 'strict'."
-            )
-        low = np.nextafter(lower_bound_array, np.inf, dtype=dt)
-        high = None if upper_bound is None else np.nextafter(upper_bound, -np.inf, dtype=dt)  # , dtype=np.float32)
-        data = data.clip(low, high)
-
-    with xr.set_options(keep_attrs=True), np.errstate(divide="ignore"):
-        if trans == "log":
-            data_prime = data - lower_bound_array
-            if clip_next_to_bounds:
-                zero = np.nextafter(np.array(0, dtype=dt), np.inf).astype(dt)
-                data_prime = data_prime.clip(zero, None)
-            out = cast(xr.DataArray, np.log(data_prime))
-        elif trans == "logit" and upper_bound is not None:
-            data_prime = ((data - lower_bound_array) / (upper_bound_array - lower_bound_array)).astype(dt)
-            if clip_next_to_bounds:
-                zero = np.nextafter(np.array(0), np.inf, dtype=dt)
-                one = np.nextafter(np.array(1), -np.inf, dtype=dt)
-                data_prime = data_prime.clip(zero, one)
-
-            out = cast(xr.DataArray, np.log(data_prime / (1 - data_prime)))
-        else:
-            raise NotImplementedError("`trans` must be one of 'log' or 'logit'.")
+        if clip_next_to_bounds == "strict":
+            # With dask, the check is done block-wise when the data is computed.
+            if uses_dask(data):
+                data = data.copy(data=data.data.map_blocks(_check_within_bounds, lower_bound, upper_bound, dtype=dt))
+            else:
+                _check_within_bounds(data.values, lower_bound, upper_bound)
+
+    if trans not in ["log", "logit"] or (trans == "logit" and upper_bound is None):
+        raise NotImplementedError("`trans` must be one of 'log' or 'logit'.")
+    out = xr.apply_ufunc(
+        _to_additive_array,
+        data,
+        kwargs={"trans": trans, "lower": lower_bound_array, "upper": upper_bound_array, "clip": bool(clip_next_to_bounds)},
+        dask="parallelized",
+        output_dtypes=[_result_dtype(data, lower_bound_array, 1.0)],
+        keep_attrs=True,
+    )
 
     # Attributes to remember all this.
     out = out.assign_attrs(xsdba_transform=trans)
@@ -624,6 +698,20 @@ def to_additive_space(
     return out
 
 
+def _from_additive_array(arr: np.ndarray, trans: str, lower: np.ndarray, upper: np.ndarray | None = None) -> np.ndarray:
+    """Back-transform `arr` from the additive space in a single output buffer, see :py:func:`from_additive_space`."""
+    out = np.empty(np.shape(arr), dtype=np.result_type(arr, lower))
+    if trans == "log":
+        np.exp(arr, out=out)
+    else:
+        np.negative(arr, out=out)
+        np.exp(out, out=out)
+        out += 1
+        np.divide(upper - lower, out, out=out)
+    out += lower
+    return out
+
+
 @update_xsdba_history
 def from_additive_space(
     data: xr.DataArray,
@@ -712,17 +800,16 @@ def from_additive_space(
     else:
         raise ValueError("Parameters missing. Either all parameters are given as attributes of data, or all of them are given as input arguments.")
 
-    with xr.set_options(keep_attrs=True):
-        if trans == "log":
-            out = np.exp(data) + lower_bound_array
-        elif trans == "logit" and upper_bound_array is not None:
-            out_prime = 1 / (1 + np.exp(-data))
-            out = (
-                out_prime * (upper_bound_array - lower_bound_array)  # pylint: disable=E0606
-                + lower_bound_array
-            )
-        else:
-            raise NotImplementedError("`trans` must be one of 'log' or 'logit'.")
+    if trans not in ["log", "logit"]:
+        raise NotImplementedError("`trans` must be one of 'log' or 'logit'.")
+    out = xr.apply_ufunc(
+        _from_additive_array,
+        data,
+        kwargs={"trans": trans, "lower": lower_bound_array, "upper": upper_bound_array},  # pylint: disable=E0606
+        dask="parallelized",
+        output_dtypes=[_result_dtype(data, lower_bound_array)],
+        keep_attrs=True,
+    )
 
     # Remove unneeded attributes, put correct units back.
     out.attrs.pop("xsdba_transform", None)
@@ -773,7 +860,17 @@ def stack_variables(ds: xr.Dataset, rechunk: bool = True, dim: str = "multivar")
     attrs["is_variables"] = True
     var_crd = xr.DataArray([nm for nm, vr in data_vars], dims=(dim,), name=dim)
 
-    da = xr.concat([vr for nm, vr in data_vars], var_crd, combine_attrs="drop")
+    first = data_vars[0][1]
+    if all(vr.dims == first.dims for _nm, vr in data_vars):
+        # The variables of a dataset are already aligned, stack their data directly instead of going through `xr.concat`.
+        stack = dsk.stack if uses_dask(ds) else np.stack
+        da = xr.DataArray(
+            stack([vr.data for _nm, vr in data_vars], axis=0),
+            dims=(dim, *first.dims),
+            coords={**first.coords, dim: var_crd},
+        )
+    else:
+        da = xr.concat([vr for nm, vr in data_vars], var_crd, combine_attrs="drop")
 
     if uses_dask(da) and rechunk:
         da = da.chunk({dim: -1})
@@ -809,8 +906,9 @@ def unstack_variables(da: xr.DataArray, dim: str | None = None) -> xr.Dataset:
         else:
             raise ValueError("No variable coordinate found, were attributes removed?")
 
+    names = da[dim].values.tolist()
     ds = xr.Dataset(
-        {name.item(): da.sel({dim: name.item()}, drop=True) for name in da[dim]},
+        {name: da.isel({dim: i}, drop=True) for i, name in enumerate(names)},
         attrs=da.attrs,
     )
     del ds.attrs["units"]
@@ -819,9 +917,9 @@ def unstack_variables(da: xr.DataArray, dim: str | None = None) -> xr.Dataset:
     for name, attr_list in da[dim].attrs.items():
         if not name.startswith("_"):
             continue
-        for attr, var in zip(attr_list, da[dim], strict=False):
+        for attr, var in zip(attr_list, names, strict=False):
             if attr is not None:
-                ds[var.item()].attrs[name[1:]] = attr
+                ds[var].attrs[name[1:]] = attr
 
     return ds
 
@@ -846,14 +944,6 @@ def grouped_time_indexes(times, group):
     gw_idxs : xr.DataArray
         Time indexes of the blocks (with rolling window if any).
     """
-
-    def _get_group_complement(da, _gr):
-        if _gr == "time.dayofyear":
-            return da.time.dt.year
-        if _gr == "time.month":
-            return da.time.dt.strftime("%Y-%m")
-        raise NotImplementedError(f"Grouping {_gr} not implemented.")
-
     group = group if isinstance(group, Grouper) else Grouper(group)
     gr, win = group.name, group.window
 
@@ -865,17 +955,27 @@ def grouped_time_indexes(times, group):
     win_dim0, win_dim = (get_temp_dimname(timeind.dims, lab) for lab in ("win_dim0", "win_dim"))
 
     if gr == "time.dayofyear":
+        # Fill tables of time indexes with one row per day of year and one column per year (and window element).
+        # Missing days (e.g. the 366th day of non-leap years) are left as NaN.
+        doys, idoys = np.unique(times.dt.dayofyear.values, return_inverse=True)
+        years, iyears = np.unique(times.dt.year.values, return_inverse=True)
 
-        def _map_group(da):
-            return da.assign_coords(time=_get_group_complement(da, gr)).rename(time="group")
+        g_table = np.full((doys.size, years.size), np.nan)
+        g_table[idoys, iyears] = timeind.values
+        g_idxs = xr.DataArray(g_table, dims=(group.prop, "group"), coords={group.prop: doys, "group": years})
 
-        g_idxs = timeind.groupby(gr).map(_map_group)
         rolled = timeind.rolling(time=win, center=True).construct(window_dim=win_dim0)
-
-        def _map_group_window(da):
-            return da.assign_coords(time=_get_group_complement(da, gr)).stack({win_dim: ["time", win_dim0]})
-
-        gw_idxs = rolled.groupby(gr).map(_map_group_window).transpose(..., win_dim)
+        gw_table = np.full((doys.size, years.size, win), np.nan)
+        gw_table[idoys, iyears] = rolled.values
+        win_crd = xr.Coordinates.from_pandas_multiindex(
+            pd.MultiIndex.from_product([years, np.arange(win)], names=["time", win_dim0]),
+            win_dim,
+        )
+        gw_idxs = xr.DataArray(
+            gw_table.reshape(doys.size, -1),
+            dims=(group.prop, win_dim),
+            coords={group.prop: doys},
+        ).assign_coords(win_crd)
 
     elif gr == "time":
         gw_idxs = timeind.rename(time=win_dim).expand_dims({win_dim0: [-1]})
@@ -891,21 +991,17 @@ def grouped_time_indexes(times, group):
 
         def _build_idxs(win):
             offsets = np.arange(-(win - 1) // 2, (win - 1) // 2 + 1)
-            base = np.concatenate([np.arange(5) + 5 * iwin + 365 * iyear for iyear in range(len(years)) for iwin in offsets])
-
-            base = xr.DataArray(
-                base,
-                dims=win_dim,
-                coords={win_dim: np.arange(base.size)},
+            # Indexes of the first block, ordered by year, window offset and day within the block.
+            base = np.add.outer(365 * np.arange(len(years)), np.add.outer(5 * offsets, np.arange(5)).ravel()).ravel()
+            blocks = np.arange(365 // 5)
+            idxs = base + 5 * blocks[:, np.newaxis]
+            idxs = np.where((idxs >= imin) & (idxs <= imax), idxs, -1)
+            return xr.DataArray(
+                idxs,
+                dims=(gr_dim, win_dim),
+                coords={gr_dim: blocks, win_dim: np.arange(base.size)},
             )
 
-            idxs = xr.concat(
-                [(base + 5 * i).expand_dims({gr_dim: [i]}) for i in range(365 // 5)],
-                dim=gr_dim,
-            )
-
-            return idxs.where((idxs >= imin) & (idxs <= imax), -1)
-
         g_idxs = _build_idxs(1)
         gw_idxs = _build_idxs(win)
 
@@ -919,34 +1015,6 @@ def grouped_time_indexes(times, group):
 
 
 # spectral utils
-def _make_mask(template, cond_vals):
-    """
-    Create a mask from a series of conditions.
-
-    Parameters
-    ----------
-    template : xr.DataArray
-        Array with the dimensions to be filtered.
-    cond_vals : tuple
-        The list of (condition, value) pairs applied to create the mask.
-
-    Returns
-    -------
-    xarray.DataArray, [unitless]
-        Mask based on the condition values.
-
-    Notes
-    -----
-    Conditions are allowed to have any values. The idea is to create a
-    soft mask with values between 0 and 1, which allows to implement smooth
-    filters.
-    """
-    mask = xr.full_like(template, 1)
-    for cond, val in cond_vals:
-        mask = mask.where(cond == False, val)
-    return mask
-
-
 def cos2_mask_func(da, low, high):
     """
     Create a mask applied Fourier coefficient with a cosine squared filter
@@ -971,16 +1039,9 @@ def cos2_mask_func(da, low, high):
     The mask is 1 below `low`, 0 above `high`, and transitions from 1 to 0
     following a cosine profile between `low` and `high`.
     """
-    cond_vals = [
-        # This first condition could be removed; The mask starts as an array of 1's
-        (da < low, 1),
-        (da > high, 0),
-        (
-            (da >= low) & (da <= high),
-            np.cos(((da - low) / (high - low)) * (np.pi / 2)) ** 2,
-        ),
-    ]
-    return _make_mask(da, cond_vals)
+    t = np.clip((da - low) / (high - low), 0, 1)
+    # cos²(πt/2) written as (1 + cos(πt)) / 2, which is exactly 0 at t = 1.
+    return (1 + np.cos(np.pi * t)) / 2
 
 
 def _normalized_radial_wavenumber(da, dims):
@@ -1033,10 +1094,50 @@ def _normalized_radial_wavenumber(da, dims):
     return alpha
 
 
-def _dctn_filter(arr, mask):
-    """Multiply the Fourier (Discrete cosine transform) coefficients by a filter which takes values between 0 and 1."""
-    coeffs = (dctn(arr, norm="ortho"),)
-    return idctn(coeffs * mask, norm="ortho")
+@lru_cache(maxsize=16)
+def _spectral_mask(
+    sizes: tuple[tuple[str, int], ...],
+    alpha_low: float,
+    alpha_high: float,
+    mask_func: Callable,
+    dtype: np.dtype = np.float64,
+) -> np.ndarray:
+    """
+    Compute the mask of the spectral filter for a field with the given dimension sizes.
+
+    The normalized radial wavenumber is the same as :py:func:`_normalized_radial_wavenumber`, but is computed
+    directly from the sizes. It is given to `mask_func` as a plain array for :py:func:`cos2_mask_func` and as a
+    DataArray for other functions. The mask is computed in double precision and then cast to `dtype`.
+    Masks are cached and returned as read-only arrays.
+    """
+    wavenumbers = np.ix_(*[np.arange(n) ** 2 / n**2 for _, n in sizes])
+    alpha = sum(wavenumbers) ** 0.5
+    if mask_func is not cos2_mask_func:
+        alpha = xr.DataArray(alpha, dims=[d for d, _ in sizes])
+    mask = np.array(mask_func(alpha, alpha_low, alpha_high), dtype=dtype)
+    mask.flags.writeable = False
+    return mask
+
+
+def _dctn_filter(arr, mask, axes, workers=None):
+    """
+    Multiply the Fourier (Discrete cosine transform) coefficients by a filter which takes values between 0 and 1.
+
+    The transforms are computed along `axes` only, so all slices of `arr` along the other axes are filtered at once,
+    using `workers` threads (see :py:func:`scipy.fft.dctn`).
+    """
+    if not mask.any() or (mask == 1).all():
+        # Zero or identity filter: the transforms can be skipped.
+        # Slices with NaNs are still entirely NaN, as they would be after the transforms.
+        out = np.multiply(arr, mask, dtype=np.result_type(arr, mask))
+        return np.where(np.isnan(out).any(axis=axes, keepdims=True), np.nan, out)
+    # The core dimensions moved last by `apply_ufunc` are usually a strided view of the data.
+    # A contiguous copy keeps the transformed axes contiguous in memory and can be overwritten by the transform.
+    carr = np.ascontiguousarray(arr)
+    coeffs = dctn(carr, norm="ortho", axes=axes, overwrite_x=carr is not arr, workers=workers)
+    # The coefficients are a new array and can be filtered in place, unless the mask upcasts them.
+    coeffs = np.multiply(coeffs, mask, out=coeffs if coeffs.dtype == np.result_type(coeffs, mask) else None)
+    return idctn(coeffs, norm="ortho", axes=axes, overwrite_x=True, workers=workers)
 
 
 def estimate_delta_from_cf(da: xr.DataArray):
@@ -1118,7 +1219,7 @@ def spectral_filter(
     if isinstance(da, xr.Dataset):
         out = da.copy()
         for v in da.data_vars:
-            out[v] = spectral_filter(da[v], lam_long, lam_short, dims, delta=delta)
+            out[v] = spectral_filter(da[v], dims, lam_long, lam_short, delta, alpha_low_high=alpha_low_high, mask_func=mask_func)
         return out.assign_attrs(da.attrs)
 
     if alpha_low_high is None and None in {lam_long, lam_short}:
@@ -1137,16 +1238,25 @@ def spectral_filter(
             delta = estimate_delta_from_cf(da)
         alpha_low = wavelength_to_normalized_wavenumber(lam_long, delta=delta)
         alpha_high = wavelength_to_normalized_wavenumber(lam_short, delta=delta)
-    alpha = _normalized_radial_wavenumber(da, dims)
-    mask = mask_func(alpha, alpha_low, alpha_high)
+    # A single precision mask keeps the coefficients of single precision data from being upcast.
+    mask = _spectral_mask(
+        tuple((d, da.sizes[d]) for d in dims),
+        float(alpha_low),
+        float(alpha_high),
+        mask_func,
+        np.dtype(np.float32 if da.dtype == np.float32 else np.float64),
+    )
+    # The mask is the same for all slices, it is passed as is instead of being broadcast against `da`.
+    # With dask, the blocks are already processed in parallel, so each transform is single-threaded.
     out = xr.apply_ufunc(
         _dctn_filter,
         da,
-        mask,
-        input_core_dims=[dims, dims],
+        input_core_dims=[dims],
         output_core_dims=[dims],
-        vectorize=True,
+        # Core dimensions are moved to the end by `apply_ufunc`, in the order of `dims`, like the mask.
+        kwargs={"mask": mask, "axes": tuple(range(-len(dims), 0)), "workers": 1 if uses_dask(da) else -1},
         dask="parallelized",
+        output_dtypes=[_result_dtype(da, mask)],
         dask_gufunc_kwargs={"allow_rechunk": True},
         keep_attrs=True,
     )
@@ -18,13 +18,13 @@ import xarray as xr
 import xclim.indices.run_length as rl
 from scipy import stats
 from scipy.fft import dctn
-from statsmodels.tsa import stattools
 from xclim.core.indicator import Indicator, base_registry
 from xclim.indices.generic import compare, select_resample_op
 from xclim.indices.stats import fit, parametric_quantile
 
-from xsdba.base import Grouper, map_groups, parse_group, uses_dask
+from xsdba.base import Grouper, ensure_chunk_size, map_groups, parse_group, uses_dask
 from xsdba.nbutils import _pairwise_haversine_and_bins
+from xsdba.nbutils import _quantile as _nan_quantile
 from xsdba.processing import _normalized_radial_wavenumber
 from xsdba.units import (
     convert_units_to,
@@ -246,13 +246,16 @@ def _skewness(da: xr.DataArray, *, group: str | Grouper = "time") -> xr.DataArra
     --------
     scipy.stats.skew
     """
+    # Rechunk once before grouping, the reduction needs all the elements of a group in one chunk.
+    da = ensure_chunk_size(da, **{group.dim: -1})
     if group.prop != "group":
         da = da.groupby(group.name)
+    # The core dimension is moved last, all cells are reduced in a single call.
     out = xr.apply_ufunc(
         stats.skew,
         da,
         input_core_dims=[[group.dim]],
-        vectorize=True,
+        kwargs={"axis": -1},
         dask="parallelized",
     )
     out.attrs["units"] = ""
@@ -285,15 +288,68 @@ def _quantile(da: xr.DataArray, *, q: float = 0.98, group: str | Grouper = "time
         Quantile {q} of the variable.
     """
     u = da.units
-    if group.prop != "group":
-        da = da.groupby(group.name)
-    out = da.quantile(q, dim=group.dim, keep_attrs=True).drop_vars("quantile")
-    return out.assign_attrs(units=u)
+    if group.prop == "group":
+        out = da.quantile(q, dim=group.dim, keep_attrs=True).drop_vars("quantile")
+        return out.assign_attrs(units=u)
+    # Rechunk once, the reduction needs all the elements of a group in one chunk.
+    da = ensure_chunk_size(da, **{group.dim: -1})
+    labels, codes = np.unique(da[group.name].values, return_inverse=True)
+    dtype = da.dtype if np.issubdtype(da.dtype, np.floating) else np.dtype(np.float64)
+    out = xr.apply_ufunc(
+        _grouped_nanquantile,
+        da,
+        input_core_dims=[[group.dim]],
+        output_core_dims=[[group.prop]],
+        kwargs={"q": q, "codes": codes, "ngroups": labels.size, "dtype": dtype},
+        dask="parallelized",
+        output_dtypes=[dtype],
+        dask_gufunc_kwargs={"output_sizes": {group.prop: labels.size}},
+        keep_attrs=True,
+    )
+    # The groups take the place of the main dimension, as with a groupby reduction.
+    out = out.transpose(*[group.prop if d == group.dim else d for d in da.dims])
+    return out.assign_coords({group.prop: labels}).assign_attrs(units=u)
+
+
+def _pad_groups(arr, codes, ngroups, fill, dtype):
+    """
+    Scatter the elements of the last axis of `arr` into a (..., group, member) array padded with `fill`.
+
+    The groups are given by the integer `codes` of the elements, which keep their order within each group.
+    """
+    order = np.argsort(codes, kind="stable")
+    counts = np.bincount(codes, minlength=ngroups)
+    member = np.arange(codes.size) - np.repeat(np.cumsum(counts) - counts, counts)
+    padded = np.full(arr.shape[:-1] + (ngroups, counts.max()), fill, dtype=dtype)
+    padded[..., codes[order], member] = arr[..., order]
+    return padded
+
+
+def _grouped_nanquantile(arr, *, q, codes, ngroups, dtype):
+    """
+    Quantile `q` of each group along the last axis of `arr`, ignoring NaNs.
+
+    The groups are given by the integer `codes` of the elements. Each group is reduced
+    for all cells at once by the numba quantile of :py:mod:`xsdba.nbutils`.
+    """
+    qs = np.array([q], dtype=dtype)
+    out = np.empty(arr.shape[:-1] + (ngroups,), dtype=dtype)
+    for g in range(ngroups):
+        # Boolean indexing copies the group, the numba quantile sorts it in place.
+        out[..., g] = _nan_quantile(arr[..., codes == g].astype(dtype, copy=False), qs, nreduce=1)[..., 0]
+    return out
 
 
 quantile = StatisticalProperty(identifier="quantile", aspect="marginal", compute=_quantile)
 
 
+def _group_first_notnull(da: xr.DataArray, group: Grouper) -> xr.DataArray:
+    """Mask of the points that are not null on the first time step of each group, e.g. to mask the ocean."""
+    if group.prop == "group":
+        return ~(da.isel({group.dim: 0}).isnull()).drop_vars(group.dim)
+    return ~da.groupby(group.name).first(skipna=False).isnull()
+
+
 def _spell_length_distribution(
     da: xr.DataArray,
     *,
@@ -366,12 +422,11 @@ def _spell_length_distribution(
         # PB: This prevents an import error in the distributed dask scheduler, but I don't know why.
         import xarray.core.resample_cftime  # noqa: F401, pylint: disable=unused-import
 
-        da = ds.data
-        mask = ~(da.isel({dim: 0}).isnull()).drop_vars(dim)  # mask of the ocean with NaNs
         if method == "quantile":
-            thresh = da.quantile(thresh, dim=dim).drop_vars("quantile")
-
-        cond = compare(da, op, thresh)
+            thresh = ds.data.quantile(thresh, dim=dim).drop_vars("quantile")
+            cond = compare(ds.data, op, thresh)
+        else:
+            cond = ds.cond
         out = rl.resample_and_rl(
             cond,
             resample_before_rl,
@@ -382,7 +437,6 @@ def _spell_length_distribution(
             freq=freq,
         )
         out = getattr(out, stat)(dim=dim)
-        out = out.where(mask)
         return out.rename("out").to_dataset()
 
     # threshold is an amount that will be converted to the right units
@@ -391,8 +445,10 @@ def _spell_length_distribution(
     elif method != "quantile":
         raise ValueError(f"{method} is not a valid method. Choose 'amount' or 'quantile'.")
 
+    # With an amount, the condition is the same for all groups and only the boolean array is passed on.
+    ds = compare(da, op, thresh).rename("cond") if method == "amount" else da.rename("data")
     out = _spell_stats(
-        da.rename("data").to_dataset(),
+        ds.to_dataset(),
         group=group,
         method=method,
         thresh=thresh,
@@ -403,6 +459,8 @@ def _spell_length_distribution(
         stat=stat,
         stat_resample=stat_resample or stat,
     ).out
+    # mask of the ocean with NaNs
+    out = out.where(_group_first_notnull(da, group))
     # in xclim this was managed by to_agg_units
     # will hard-code this part for now
     m, freq_u_raw = infer_sampling_units(da["time"])
@@ -505,9 +563,10 @@ def _acf(da: xr.DataArray, *, lag: int = 1, group: str | Grouper = "time.season"
     xr.DataArray, [dimensionless]
         Lag-{lag} autocorrelation of the variable over a {group.prop} and averaged over all years.
 
-    See Also
-    --------
-    statsmodels.tsa.stattools.acf
+    Notes
+    -----
+    The autocorrelation is computed like `statsmodels.tsa.stattools.acf`, with the mean and variance of each
+    resampled period.
 
     References
     ----------
@@ -515,10 +574,10 @@ def _acf(da: xr.DataArray, *, lag: int = 1, group: str | Grouper = "time.season"
     """
 
     def acf_last(x, nlags):
-        """Calculates, like Statsmodels, acf for lag 0 to nlags, but returns only the last one."""
-        # As we resample + group, timeseries are quite short and fft=False seems more performant
-        out_last = stattools.acf(x, nlags=nlags, fft=False)
-        return out_last[-1]
+        """Calculates, like Statsmodels, the acf at lag `nlags` along the last axis."""
+        # As we resample + group, timeseries are quite short and a direct sum is faster than a fft
+        x = x - x.mean(axis=-1, keepdims=True)
+        return (x[..., : x.shape[-1] - nlags] * x[..., nlags:]).sum(axis=-1) / (x * x).sum(axis=-1)
 
     @map_groups(out=[Grouper.PROP], main_only=True)
     def _acf(ds, *, dim, lag, freq):
@@ -526,7 +585,6 @@ def _acf(da: xr.DataArray, *, lag: int = 1, group: str | Grouper = "time.season"
             acf_last,
             ds.data.resample({dim: freq}),
             input_core_dims=[[dim]],
-            vectorize=True,
             kwargs={"nlags": lag},
         )
         out = out.mean("__resample_dim__")
@@ -584,13 +642,16 @@ def _annual_cycle(
 
     ac = da.groupby("time.dayofyear").mean()
     if window > 1:  # smooth the cycle
-        # We want the rolling mean to be circular. There's no built-in method to do this in xarray,
-        # we'll pad the array and extract the meaningful part.
-        ac = (
-            ac.pad(dayofyear=(window // 2), mode="wrap")
-            .rolling(dayofyear=window, center=True)
-            .mean()
-            .isel(dayofyear=slice(window // 2, -(window // 2)))
+        # We want the rolling mean to be circular. There's no built-in method to do this in xarray.
+        ac = xr.apply_ufunc(
+            _circular_moving_average,
+            ac,
+            input_core_dims=[["dayofyear"]],
+            output_core_dims=[["dayofyear"]],
+            kwargs={"window": window},
+            dask="parallelized",
+            dask_gufunc_kwargs={"allow_rechunk": True},
+            keep_attrs=True,
         )
     match stat:
         case "absamp":
@@ -616,6 +677,24 @@ def _annual_cycle(
     return out
 
 
+def _circular_moving_average(arr, window):
+    """
+    Centered moving average along the last axis of `arr`, wrapping around its ends.
+
+    The windows are placed as with ``xarray.DataArray.rolling(center=True)``, and those with a NaN give NaN.
+    The sums are taken as differences of a cumulative sum, so the cost does not depend on `window`.
+    """
+    before = window // 2
+    after = window - before - 1
+    n = arr.shape[-1]
+    ext = np.concatenate([arr[..., n - before :], arr, arr[..., :after]], axis=-1)
+    isnan = np.isnan(ext)
+    csum, cnan = (np.cumsum(x, axis=-1) for x in (np.where(isnan, 0, ext), isnan))
+    csum, cnan = (np.concatenate([np.zeros_like(x[..., :1]), x], axis=-1) for x in (csum, cnan))
+    out = (csum[..., window:] - csum[..., :-window]) / window
+    return np.where(cnan[..., window:] > cnan[..., :-window], np.nan, out)
+
+
 annual_cycle_amplitude = StatisticalProperty(
     identifier="annual_cycle_amplitude",
     aspect="temporal",
@@ -719,7 +798,23 @@ def _annual_statistic(
             out = (yrs.max() - yrs.min()) * 100 / yrs.mean()
             out.attrs["units"] = "%"
         case "phase":
-            out = yrs.map(xr.DataArray.idxmax).dt.dayofyear
+            da = ensure_chunk_size(da, time=-1)
+            years, codes = np.unique(da.time.dt.year.values, return_inverse=True)
+            out = xr.apply_ufunc(
+                _grouped_dayofyear_of_max,
+                da,
+                input_core_dims=[["time"]],
+                output_core_dims=[["time"]],
+                exclude_dims={"time"},
+                kwargs={
+                    "codes": codes,
+                    "ngroups": years.size,
+                    "doy": _pad_groups(da.time.dt.dayofyear.values, codes, years.size, 0, int),
+                },
+                dask="parallelized",
+                output_dtypes=[np.float64],
+                dask_gufunc_kwargs={"output_sizes": {"time": years.size}},
+            )
             out.attrs.update(units="", is_dayofyear=np.int32(1))
         case _:
             raise NotImplementedError(f"{stat} is not a valid annual cycle statistic.")
@@ -727,6 +822,19 @@ def _annual_statistic(
     return out.mean("time", keep_attrs=True)
 
 
+def _grouped_dayofyear_of_max(arr, *, codes, ngroups, doy):
+    """
+    Day of year of the maximum of each group along the last axis of `arr`, ignoring NaNs.
+
+    The groups are given by the integer `codes` of the elements and `doy` is the day of year of the
+    elements, padded into a (group, member) array. Groups with only NaNs give NaN.
+    """
+    padded = _pad_groups(arr, codes, ngroups, np.nan, np.float64)
+    allnan = np.isnan(padded).all(axis=-1)
+    imax = np.where(np.isnan(padded), -np.inf, padded).argmax(axis=-1)
+    return np.where(allnan, np.nan, doy[np.arange(ngroups), imax])
+
+
 mean_annual_range = StatisticalProperty(
     identifier="mean_annual_range",
     aspect="temporal",
@@ -795,31 +903,45 @@ def _corr_btw_var(
 
     index = {"correlation": 0, "pvalue": 1}[output]
 
-    def _first_output_1d(a, b, index, corr_type):
-        """Only keep the correlation (first output) from the scipy function."""
-        # for points in the water with NaNs
-        if np.isnan(a).all():
-            return np.nan
-        aok = ~np.isnan(a)
-        bok = ~np.isnan(b)
+    def _first_output_nd(a, b, index, corr_type):
+        """Correlation coefficient or p-value along the last axis, only using the pairs without NaNs."""
+        ok = ~(np.isnan(a) | np.isnan(b))
+        n = ok.sum(axis=-1)
+        if corr_type == "Pearson":
+            a, b = (np.where(ok, x, 0).astype(np.float64) for x in (a, b))
+        else:
+            # Ranks among the valid pairs, the others are NaN.
+            a, b = (np.where(ok, stats.rankdata(np.where(ok, x, np.nan), axis=-1, nan_policy="omit"), 0) for x in (a, b))
+        # for points in the water with NaNs, or constant series, the coefficient is NaN
+        with np.errstate(divide="ignore", invalid="ignore"):
+            a, b = (np.where(ok, x - x.sum(axis=-1, keepdims=True) / n[..., np.newaxis], 0) for x in (a, b))
+            r = np.clip((a * b).sum(axis=-1) / np.sqrt((a * a).sum(axis=-1) * (b * b).sum(axis=-1)), -1, 1)
+            if index == 0:
+                return r
+            # Two-sided p-value of the t-test, as in `scipy.stats.pearsonr` and `scipy.stats.spearmanr`.
+            dof = n - 2
+            pval = 2 * stats.t.sf(np.abs(r * np.sqrt(dof / ((1 - r) * (1 + r)))), dof)
         if corr_type == "Pearson":
-            return stats.pearsonr(a[aok & bok], b[aok & bok])[index]
-        return stats.spearmanr(a[aok & bok], b[aok & bok])[index]
+            # Two points are always perfectly correlated
+            pval = np.where(n == 2, 1.0, pval)
+        return pval
 
     @map_groups(out=[Grouper.PROP], main_only=True)
     def _first_output(ds, *, dim, index, corr_type):
         out = xr.apply_ufunc(
-            _first_output_1d,
+            _first_output_nd,
             ds.a,
             ds.b,
             input_core_dims=[[dim], [dim]],
-            vectorize=True,
             dask="parallelized",
+            output_dtypes=[np.float64],
             kwargs={"index": index, "corr_type": corr_type},
         )
         return out.rename("out").to_dataset()
 
-    out = _first_output(xr.Dataset({"a": da1, "b": da2}), group=group, index=index, corr_type=corr_type).out
+    # Rechunk once before grouping, the correlation needs all the elements of a group in one chunk.
+    ds = xr.Dataset({"a": ensure_chunk_size(da1, **{group.dim: -1}), "b": ensure_chunk_size(da2, **{group.dim: -1})})
+    out = _first_output(ds, group=group, index=index, corr_type=corr_type).out
     out.attrs["units"] = ""
     return out
 
@@ -920,13 +1042,13 @@ def _bivariate_spell_length_distribution(
         import xarray.core.resample_cftime  # noqa: F401, pylint: disable=unused-import
 
         conds = []
-        masks = []
-        for da, thresh, op, method in zip([ds.da1, ds.da2], threshs, ops, methods, strict=False):
-            masks.append(~(da.isel({dim: 0}).isnull()).drop_vars(dim))  # mask of the ocean with NaNs
+        for i, (thresh, op, method) in enumerate(zip(threshs, ops, methods, strict=False), 1):
             if method == "quantile":
+                da = ds[f"da{i}"]
                 thresh = da.quantile(thresh, dim=dim).drop_vars("quantile")
-            conds.append(compare(da, op, thresh))
-        mask = masks[0] & masks[1]
+                conds.append(compare(da, op, thresh))
+            else:
+                conds.append(ds[f"cond{i}"])
         cond = conds[0] & conds[1]
         out = rl.resample_and_rl(
             cond,
@@ -938,7 +1060,6 @@ def _bivariate_spell_length_distribution(
             freq=freq,
         )
         out = getattr(out, stat)(dim=dim)
-        out = out.where(mask)
         return out.rename("out").to_dataset()
 
     # threshold is an amount that will be converted to the right units
@@ -950,8 +1071,16 @@ def _bivariate_spell_length_distribution(
         elif methods[i] != "quantile":
             raise ValueError(f"{methods[i]} is not a valid method. Choose 'amount' or 'quantile'.")
 
+    # With an amount, the condition is the same for all groups and only the boolean array is passed on.
+    data = {}
+    for i, (d, thresh, op, method) in enumerate(zip([da1, da2], threshs, [op1, op2], methods, strict=False), 1):
+        if method == "amount":
+            data[f"cond{i}"] = compare(d, op, thresh)
+        else:
+            data[f"da{i}"] = d
+    ds = xr.Dataset(data)
     out = _bivariate_spell_stats(
-        xr.Dataset({"da1": da1, "da2": da2}),
+        ds,
         group=group,
         threshs=threshs,
         methods=methods,
@@ -962,6 +1091,8 @@ def _bivariate_spell_length_distribution(
         stat=stat,
         stat_resample=stat_resample or stat,
     ).out
+    # mask of the ocean with NaNs
+    out = out.where(_group_first_notnull(da1, group) & _group_first_notnull(da2, group))
     # in xclim this was managed by to_agg_units
     # will hard-code this part for now
     m, freq_u_raw = infer_sampling_units(da["time"])
@@ -1113,10 +1244,8 @@ def _relative_frequency(
     cond = compare(da, op, t)
     if group.prop != "group":  # change the time resolution if necessary
         cond = cond.groupby(group.name)
-        # length of the groupBy groups
-        length = np.array([len(v) for v in cond.groups.values()])
-        for _ in range(da.ndim - 1):  # add empty dimension(s) to match input
-            length = np.expand_dims(length, axis=-1)
+        # length of the groupBy groups, in the sorted order of the group labels
+        length = xr.DataArray(np.unique(da[group.name].values, return_counts=True)[1], dims=(group.prop,))
     # count days with the condition and divide by total nb of days
     out = cond.sum(dim=group.dim, skipna=False) / length
     out = out.where(mask, np.nan)
@@ -1169,10 +1298,11 @@ def _transition_probability(
     mask = ~(da.isel({group.dim: 0}).isnull()).drop_vars(group.dim)
 
     today = da.isel(time=slice(0, -1))
-    tomorrow = da.shift(time=-1).isel(time=slice(0, -1))
+    # The next day is labeled with the time of the day before, to be grouped with it.
+    tomorrow = da.isel(time=slice(1, None)).assign_coords(time=today.time.values)
 
     t = convert_units_to(thresh, da)
-    cond = compare(today, initial_op, t) * compare(tomorrow, final_op, t)
+    cond = compare(today, initial_op, t) & compare(tomorrow, final_op, t)
     out = group.apply("mean", cond)
     out = out.where(mask, np.nan)
     out.attrs["units"] = ""
@@ -1236,17 +1366,47 @@ def _trend(
     if group.prop != "group":
         da_mean = da_mean.groupby(group.name)  # group all month/season together
 
-    def modified_lr(
-        x,
-    ):  # modify linregress to fit into apply_ufunc and only return slope
-        return getattr(stats.linregress(list(range(len(x))), x), output)
+    def modified_lr(y):
+        """Like scipy.stats.linregress of `y` against 0, 1, ..., n-1, along the last axis, but only return `output`."""
+        y = np.asarray(y, dtype=np.float64)
+        n = y.shape[-1]
+        xmean = (n - 1) / 2
+        x = np.arange(n) - xmean
+        ymean = y.mean(axis=-1)
+        # Biased (co)variances, as in linregress. The abscissa is centered, so sum(x * (y - ymean)) = sum(x * y).
+        ssxm = (x**2).mean()
+        ssxym = (x * y).mean(axis=-1)
+        slope = ssxym / ssxm
+        if output == "slope":
+            return slope
+        if output == "intercept":
+            return ymean - slope * xmean
+        ssym = ((y - ymean[..., np.newaxis]) ** 2).mean(axis=-1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            r = np.where(ssym == 0, 0.0, np.clip(ssxym / np.sqrt(ssxm * ssym), -1, 1))
+        if output == "rvalue":
+            return r
+        df = n - 2
+        if output == "pvalue":
+            if n == 2:
+                return np.where(y[..., 0] == y[..., 1], 1.0, 0.0)
+            # TINY avoids the division by zero for perfect correlations, as in linregress.
+            tiny = 1.0e-20
+            t = r * np.sqrt(df / ((1.0 - r + tiny) * (1.0 + r + tiny)))
+            return 2 * stats.t.sf(np.abs(t), df)
+        slope_stderr = np.sqrt((1 - r**2) * ssym / ssxm / df) if n > 2 else np.zeros_like(r)
+        if output == "stderr":
+            return slope_stderr
+        if output == "intercept_stderr":
+            return slope_stderr * np.sqrt(ssxm + xmean**2)
+        raise ValueError(f"{output} is not a valid output. Choose one of the attributes of `scipy.stats.linregress`.")
 
     out = xr.apply_ufunc(
         modified_lr,
         da_mean,
         input_core_dims=[[group.dim]],
-        vectorize=True,
         dask="parallelized",
+        output_dtypes=[np.float64],
     )
     out.attrs["units"] = f"{u}/year"
     return out
@@ -1307,15 +1467,27 @@ def _return_value(
 return_value = StatisticalProperty(identifier="return_value", aspect="temporal", compute=_return_value)
 
 
-def _bin_correlations(corr, distance, edges):
-    """Bin and mean."""
-    mask_nan = ~np.isnan(corr)
-    if mask_nan.any():
-        binned_corr = stats.binned_statistic(distance[mask_nan], corr[mask_nan], statistic="mean", bins=edges)
-        stat = binned_corr.statistic
-    else:
-        stat = np.nan * stats.binned_statistic([0], [0], statistic="mean", bins=edges).statistic
-    return stat
+def _bin_correlations(corr, distance, edges, ndims=1):
+    """
+    Bin and mean.
+
+    The correlations are averaged in each bin of distance over their last `ndims` axes, for all the other axes at once.
+    As in :py:func:`scipy.stats.binned_statistic`, the bins include their left edge and the last one also its right edge.
+    """
+    edges = np.ravel(edges)
+    nbins = edges.size - 1
+    corr, distance = np.broadcast_arrays(corr, distance)
+    shape = corr.shape[: corr.ndim - ndims]
+    corr = corr.reshape(shape + (-1,))
+    idx = np.searchsorted(edges, distance.reshape(corr.shape), side="right") - 1
+    idx[distance.reshape(corr.shape) == edges[-1]] = nbins - 1
+    valid = ~np.isnan(corr) & (idx >= 0) & (idx < nbins)
+    # Flat index of the bins of all slices, so that a single bincount does the sums of all slices.
+    flat = (np.arange(corr[..., 0].size).reshape(corr.shape[:-1] + (1,)) * nbins + idx)[valid]
+    num = np.bincount(flat, weights=corr[valid], minlength=corr[..., 0].size * nbins)
+    den = np.bincount(flat, minlength=corr[..., 0].size * nbins)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return (num / den).reshape(shape + (nbins,))
 
 
 @parse_group
@@ -1378,7 +1550,6 @@ def _spatial_correlogram(
         },
     )
 
-    dists = dists.where(corr.notnull())
     edges = xr.DataArray(bins, dims=("bin_edges",))
 
     # (_spatial, _spatial2) -> (_spatial, distance_bins)
@@ -1389,8 +1560,8 @@ def _spatial_correlogram(
         edges,
         input_core_dims=[["_spatial", "_spatial2"], ["_spatial", "_spatial2"], ["bin_edges"]],
         output_core_dims=[["distance_bins"]],
+        kwargs={"ndims": 2},
         dask="parallelized",
-        vectorize=True,
         output_dtypes=[float],
         dask_gufunc_kwargs={
             "allow_rechunk": True,
@@ -1460,10 +1631,9 @@ def _decorrelation_length(
         corr = _pairwise_spearman(da, dims)
         dists, _, _ = _pairwise_haversine_and_bins(corr.cf["longitude"].values, corr.cf["latitude"].values, transpose=True)
 
+    # With `transpose=True`, the distances are symmetric, so they are also the distances of the transposed pairs.
     dists = xr.DataArray(dists, dims=corr.dims, coords=corr.coords, name="distance")
 
-    trans_dists = xr.DataArray(dists.T, dims=corr.dims, coords=corr.coords, name="distance")
-
     if np.isscalar(bins):
         bins = np.linspace(0, radius, bins + 1)
     elif not isinstance(bins, np.ndarray):
@@ -1471,7 +1641,6 @@ def _decorrelation_length(
 
     if uses_dask(corr):
         dists = dists.chunk()
-        trans_dists = trans_dists.chunk()
 
     w = np.diff(bins)
     centers = xr.DataArray(
@@ -1482,11 +1651,10 @@ def _decorrelation_length(
             "long_name": f"Centers of the intersite distance bins (width of {w[0]:.3f} km)",
         },
     )
-    ds = xr.Dataset({"corr": corr, "distance": dists, "distance2": trans_dists})
+    ds = xr.Dataset({"corr": corr, "distance": dists})
 
     # only keep points inside the radius
     ds = ds.where(ds.distance < radius)
-    ds = ds.where(ds.distance2 < radius)
 
     edges = xr.DataArray(bins, dims=("bin_edges",))
 
@@ -1500,7 +1668,6 @@ def _decorrelation_length(
             input_core_dims=[["_spatial2"], ["_spatial2"], ["bin_edges"]],
             output_core_dims=[["distance_bins"]],
             dask="parallelized",
-            vectorize=True,
             output_dtypes=[float],
             dask_gufunc_kwargs={
                 "allow_rechunk": True,
@@ -1563,14 +1730,16 @@ def _spectral_variance_alpha(da, dims):
     :cite:cts:`denis_spectral_2002`
     """
     # compute variance as a function of alpha
+    # All slices along the other dimensions are transformed at once, along the core dimensions moved last.
+    # With dask, the blocks are already processed in parallel, so each transform is single-threaded.
     Fmn = xr.apply_ufunc(
-        lambda x: dctn(x, norm="ortho"),
+        dctn,
         da,
         input_core_dims=[dims],
         output_core_dims=[dims],
+        kwargs={"norm": "ortho", "axes": tuple(range(-len(dims), 0)), "workers": 1 if uses_dask(da) else -1},
         dask="parallelized",
         dask_gufunc_kwargs={"allow_rechunk": True},
-        vectorize=True,
         keep_attrs=True,
     )
     sizes = [da[d].size for d in dims]
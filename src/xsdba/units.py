@@ -5,7 +5,8 @@ Units Handling Submodule
 
 from __future__ import annotations
 import inspect
-from functools import wraps
+from functools import lru_cache, wraps
+from numbers import Number
 from typing import cast
 
 # this dependency is "necessary" for convert_units_to and all unit printing (which use the CF formatter)
@@ -35,6 +36,10 @@ units = pint.get_application_registry()
 # CF-xarray forces numpy arrays even for scalar values, not sure why.
 # We don't want that in xsdba, the magnitude of a scalar is a scalar (float).
 units.force_ndarray_like = False
+# The unit classes accepted by `pint2cfattrs` and `extract_units`, often the same class.
+_UNIT_TYPES = (pint.Unit,) if units.Unit is pint.Unit else (pint.Unit, units.Unit)
+# The scalar types that `extract_units` takes as having no units.
+_SCALAR_TYPES = (Number, np.generic)
 FREQ_UNITS = {
     "D": "d",
     "W": "week",
@@ -80,7 +85,11 @@ def infer_sampling_units(
     freq = xr.infer_freq(dimmed)
     if freq is None:
         freq = deffreq
+    return _freq_to_sampling_units(freq)
 
+
+def _freq_to_sampling_units(freq: str) -> tuple[int, str]:
+    """Return the multiplier and the units corresponding to one period of frequency `freq`."""
     multi, base, _, _ = parse_offset(freq)
     try:
         out = multi, FREQ_UNITS.get(base, base)
@@ -92,7 +101,7 @@ def infer_sampling_units(
     return out
 
 
-def _parse_str(value: str) -> tuple[str, str]:
+def _parse_str(value: str) -> tuple[float, str]:
     """
     Parse a str as a number and a unit.
 
@@ -103,17 +112,17 @@ def _parse_str(value: str) -> tuple[str, str]:
 
     Returns
     -------
-    tuple[str, str]
-        Magnitude and unit strings. If no magnitude is found, "1" is used by default.
+    tuple[float, str]
+        Magnitude and unit string. If no magnitude is found, 1 is used by default.
     """
     mstr, *ustr = value.split(" ", maxsplit=1)
     try:
-        mstr = str(float(mstr))
+        mag = float(mstr)
     except ValueError:
-        mstr = "1"
+        mag = 1.0
         ustr = [value]
     ustr = "dimensionless" if len(ustr) == 0 else ustr[0]
-    return mstr, ustr
+    return mag, ustr
 
 
 # XC
@@ -159,9 +168,14 @@ def units2pint(
     else:
         raise NotImplementedError(f"Value of type `{type(value)}` not supported.")
 
-    # Catch user errors undetected by Pint
-    degree_ex = ["deg", "degree", "degrees"]
-    unit_ex = [
+    return _parse_units(unit, metadata)
+
+
+# Catch user errors undetected by Pint
+_SPACED_TEMPERATURE_UNITS = frozenset(
+    f"{d} {u}"
+    for d in ["deg", "degree", "degrees"]
+    for u in [
         "C",
         "K",
         "F",
@@ -172,8 +186,13 @@ def units2pint(
         "kelvin",
         "fahrenheit",
     ]
-    possibilities = [f"{d} {u}" for d in degree_ex for u in unit_ex]
-    if unit.strip() in possibilities:
+)
+
+
+@lru_cache(maxsize=1024)
+def _parse_units(unit: str, metadata: str | None = None) -> pint.Unit:
+    """Parse a unit string and its `units_metadata`. The same units come up repeatedly, so results are cached."""
+    if unit.strip() in _SPACED_TEMPERATURE_UNITS:
         raise ValueError("Remove white space from temperature units, e.g. use `degC`.")  # FIXME: ValidationError not defined
 
     pu = units.parse_units(unit)
@@ -196,8 +215,27 @@ def units2str(value: xr.DataArray | str | units.Quantity | units.Unit) -> str:
     pint.Unit
         Units of the data array.
     """
+    # Strings and attributes are formatted through a cache, like their parsing in `units2pint`.
+    if isinstance(value, xr.DataArray):
+        value = value.attrs
+    if isinstance(value, str):
+        return _format_units(_parse_str(value)[1], None)
+    if isinstance(value, dict):
+        return _format_units(value["units"], value.get("units_metadata", None))
     # Ensure we use CF's formatter. (default with xclim, but not with only cf-xarray)
-    return f"{units2pint(value):cf}"
+    return _cf_format(units2pint(value))
+
+
+@lru_cache(maxsize=1024)
+def _format_units(unit: str, metadata: str | None = None) -> str:
+    """Format a unit string and its `units_metadata` with CF's formatter, with cached results."""
+    return _cf_format(_parse_units(unit, metadata))
+
+
+@lru_cache(maxsize=256)
+def _cf_format(unit: pint.Unit) -> str:
+    """Format a pint unit with CF's formatter, with cached results."""
+    return f"{unit:cf}"
 
 
 # XC
@@ -216,8 +254,8 @@ def str2pint(val: str) -> pint.Quantity:
     pint.Quantity
         Magnitude is 1 if no magnitude was present in the string.
     """
-    mstr, ustr = _parse_str(val)
-    return units.Quantity(float(mstr), units=units2pint(ustr))
+    mag, ustr = _parse_str(val)
+    return units.Quantity(mag, units=units2pint(ustr))
 
 
 # XC
@@ -238,16 +276,26 @@ def pint_multiply(da: xr.DataArray, q: pint.Quantity | str, out_units: str | Non
     -------
     xr.DataArray
     """
+    # The factor only depends on the units, it is cached when `q` is given as a string.
+    factor = _multiply_factor_cached if isinstance(q, str) else _multiply_factor
+    mag, u = factor(units2pint(da), q, out_units)
+    out: xr.DataArray = da * mag
+    out = out.assign_attrs(units=u)
+    return out
+
+
+def _multiply_factor(u: pint.Unit, q: pint.Quantity | str, out_units: str | None = None) -> tuple[float, str]:
+    """Magnitude and CF units of `q` times one `u`, converted to `out_units` or reduced."""
     q = q if isinstance(q, pint.Quantity) else str2pint(q)
-    a = 1 * units2pint(da)
-    f = a * q.to_base_units()
+    f = (1 * u) * q.to_base_units()
     if out_units:
         f = f.to(out_units)
     else:
         f = f.to_reduced_units()
-    out: xr.DataArray = da * float(f.magnitude)
-    out = out.assign_attrs(units=f"{f.units:cf}")
-    return out
+    return float(f.magnitude), _cf_format(f.units)
+
+
+_multiply_factor_cached = lru_cache(maxsize=256)(_multiply_factor)
 
 
 DELTA_ABSOLUTE_TEMP = {
@@ -275,8 +323,8 @@ def pint2cfattrs(value: units.Quantity | units.Unit, is_difference=None) -> dict
     dict
         Units following CF-Convention, using symbols.
     """
-    value = value if isinstance(value, pint.Unit | units.Unit) else value.units
-    s = f"{value:cf}"
+    value = value if isinstance(value, _UNIT_TYPES) else value.units
+    s = _cf_format(value)
     if "delta_" in s:
         is_difference = True
         s = s.replace("delta_", "")
@@ -298,6 +346,16 @@ def _convert_units_to(  # noqa: C901
     source: Quantified,
     target: Quantified | units.Unit,
 ) -> xr.DataArray | float:
+    # Units written the same way need no conversion, and no parsing
+    if isinstance(source, xr.DataArray) and "units" in source.attrs:
+        source_attrs = (source.attrs["units"], source.attrs.get("units_metadata", None))
+        target_attrs = None
+        if isinstance(target, xr.DataArray):
+            target_attrs = (target.attrs.get("units", None), target.attrs.get("units_metadata", None))
+        elif isinstance(target, str):
+            target_attrs = (target, None)
+        if source_attrs == target_attrs:
+            return source
     target_unit = units2str(target)
     source_unit = units2str(source)
     if target_unit == source_unit:
@@ -350,26 +408,16 @@ def extract_units(arg):
         # arg becomes str | None
         arg = arg.attrs.get("units", None)
     # "2" is assumed to be "2 dimensionless", like a DataArray with units ""
-    if isinstance(arg, pint.Unit | units.Unit | str):
+    if isinstance(arg, (str, *_UNIT_TYPES)):
         arg = units2str(arg)
     # 2 is assumed to be 2, no dimension (None), like a DataArray without units attribute
-    elif np.isscalar(arg):
+    elif isinstance(arg, _SCALAR_TYPES):
         arg = None
-    if isinstance(arg, str | None):
+    if arg is None or isinstance(arg, str):
         return arg
     raise TypeError(f"Argument must be a str | DataArray | pint.Unit | units.Unit | scalar. Got {type(arg)}")
 
 
-def _add_default_kws(params_dict, params_to_check, func):
-    """Combine args and kwargs into a dict."""
-    signature = inspect.signature(func)
-    for k, v in signature.parameters.items():
-        if k not in params_dict and k in params_to_check:
-            if v.default != inspect._empty:
-                params_dict[k] = v.default
-    return params_dict
-
-
 def harmonize_units(params_to_check):
     """Compare units and perform a conversion if possible, otherwise raise a `ValidationError`."""
 
@@ -377,19 +425,28 @@ def harmonize_units(params_to_check):
     # if units are present, then check is performed
     # in mixed cases, an error is raised
     def _decorator(func):
+        # The signature of `func` is inspected once, when it is decorated.
+        params_func = inspect.signature(func).parameters
+        arg_index = {name: i for i, name in enumerate(inspect.getfullargspec(func).args) if name in params_to_check}
+        default_kws = {k: v.default for k, v in params_func.items() if k in params_to_check and v.default is not inspect.Parameter.empty}
+        valid_params = set(params_to_check).issubset(set(params_func))
+
         @wraps(func)
         def _wrapper(*args, **kwargs):
-            params_func = inspect.signature(func).parameters.keys()
-            if set(params_to_check).issubset(set(params_func)) is False:
+            if valid_params is False:
                 raise TypeError(
                     f"`harmonize_units' inputs `{params_to_check}` should be a subset of "
-                    f"`{func.__name__}`'s arguments: `{params_func}` (arguments that can contain units)"
+                    f"`{func.__name__}`'s arguments: `{params_func.keys()}` (arguments that can contain units)"
                 )
-            arg_names = inspect.getfullargspec(func).args
-            args_dict = dict(zip(arg_names, args, strict=False))
-            params_dict = args_dict | {k: v for k, v in kwargs.items()}
-            params_dict = {k: v for k, v in params_dict.items() if k in params_to_check}
-            params_dict = _add_default_kws(params_dict, params_to_check, func)
+            # Only the checked parameters are collected, from args, kwargs or the defaults
+            params_dict = {}
+            for k in params_to_check:
+                if arg_index.get(k, len(args)) < len(args):
+                    params_dict[k] = args[arg_index[k]]
+                elif k in kwargs:
+                    params_dict[k] = kwargs[k]
+                elif k in default_kws:
+                    params_dict[k] = default_kws[k]
             if set(params_dict.keys()) != set(params_to_check):
                 raise TypeError(f"{params_to_check} were passed but only {params_dict.keys()} were found in `{func.__name__}`'s arguments")
             # # Passing datasets or thresh as float (i.e. assign no units) is accepted
@@ -405,15 +462,13 @@ def harmonize_units(params_to_check):
                     if value is None:  # optional argument, should be ignored
                         continue
                     params_dict[param_name] = convert_units_to(value, first_param)
-            # reassign keyword arguments
-            for k in [k for k in params_dict.keys() if k not in args_dict.keys()]:
-                kwargs[k] = params_dict[k]
-                params_dict.pop(k)
-            # reassign remaining arguments (passed as arg)
+            # reassign the parameters where they were found, defaults are passed as keyword arguments
             args = list(args)
-            for iarg in range(len(args)):
-                if arg_names[iarg] in params_dict.keys():
-                    args[iarg] = params_dict[arg_names[iarg]]
+            for k, v in params_dict.items():
+                if arg_index.get(k, len(args)) < len(args):
+                    args[arg_index[k]] = v
+                else:
+                    kwargs[k] = v
             return func(*args, **kwargs)
 
         return _wrapper
@@ -442,7 +497,6 @@ def wavelength_to_normalized_wavenumber(
     """
     if isinstance(lam, str):
         lam, u = _parse_str(lam)
-        lam = float(lam)
     else:
         u = lam.units
     delta = convert_units_to(delta, u)
@@ -473,7 +527,6 @@ def normalized_wavenumber_to_wavelength(alpha: xr.DataArray | float, delta: str
         u = out_units
     else:
         delta, u = _parse_str(delta)
-        delta = float(delta)
     delta = np.abs(delta)
     lam = 2 * delta / alpha
     if isinstance(alpha, xr.DataArray):
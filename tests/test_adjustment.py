@@ -1596,7 +1596,7 @@ class TestSBCKutils:
     @pytest.mark.slow
     @pytest.mark.parametrize(
         "method",
-        [m for m in dir(adjustment) if m.startswith("SBCK_")],
+        list(adjustment._get_SBCK_classes()),
     )
     @pytest.mark.parametrize("use_dask", [True])  # do we gain testing both?
     def test_sbck(self, method, use_dask, random):
@@ -32,3 +32,17 @@ class TestQuantiles:
         da = xr.DataArray([np.nan] * 100, dims="dim_0")
         out_nbu = nbu.quantile(da, q, dim="dim_0")
         np.testing.assert_array_equal(out_nbu.values, np.full_like(q, np.nan))
+
+
+def test_pairwise_haversine_transpose(random):
+    lon = random.uniform(-80, -60, 10)
+    lat = random.uniform(40, 60, 10)
+    dists, mn, mx = nbu._pairwise_haversine_and_bins(lon, lat, transpose=True)
+    # decorrelation_length relies on the symmetry to skip masking the transposed pairs
+    np.testing.assert_array_equal(dists, dists.T)
+    np.testing.assert_array_equal(np.diag(dists), 0)
+
+    upper, _, _ = nbu._pairwise_haversine_and_bins(lon, lat)
+    np.testing.assert_array_equal(dists[np.triu_indices(10, k=1)], upper[np.triu_indices(10, k=1)])
+    assert mn == np.nanmin(upper)
+    assert mx == np.nanmax(upper)
@@ -6,9 +6,9 @@ import pytest
 import xarray as xr
 import xclim
 
-from xsdba._processing import _adapt_freq
+from xsdba._processing import _adapt_freq, _normalize
 from xsdba.adjustment import EmpiricalQuantileMapping
-from xsdba.base import Grouper
+from xsdba.base import Grouper, map_groups, uses_dask
 from xsdba.processing import (
     _normalized_radial_wavenumber,
     adapt_freq,
@@ -23,14 +23,20 @@ from xsdba.processing import (
     stack_variables,
     standardize,
     to_additive_space,
+    uniform_noise_like,
     unstack_variables,
     unstandardize,
 )
+from xsdba.utils import apply_correction, invert
 
 
-def test_jitter_both():
+@pytest.mark.parametrize("use_dask", [True, False])
+def test_jitter_both(use_dask):
     da = xr.DataArray([0.5, 2.1, np.nan], attrs={"units": "K"})
+    if use_dask:
+        da = da.chunk({"dim_0": 2})
     out = jitter(da, lower="1 K", upper="2 K", maximum="3 K")
+    assert uses_dask(out) is use_dask
 
     assert da[0] != out[0]
     assert da[0] < 1
@@ -87,6 +93,31 @@ def test_jitter_log(dtype, delta, test):
     assert (np.isfinite(np.log(out / (1 - out)))).all()
 
 
+@pytest.mark.parametrize("use_dask", [True, False])
+def test_uniform_noise_like(use_dask):
+    da = xr.DataArray(np.zeros((3, 1000)), dims=("x", "time"), attrs={"units": "mm/d"})
+    if use_dask:
+        da = da.chunk({"x": 1})
+    out = uniform_noise_like(da, low=1e-6, high=1e-3)
+    assert uses_dask(out) is use_dask
+    assert out.dims == da.dims
+    assert out.attrs == da.attrs
+    assert ((out >= 1e-6) & (out < 1e-3)).all()
+
+
+@pytest.mark.parametrize("use_dask", [True, False])
+def test_uniform_noise_like_seed(use_dask):
+    da = xr.DataArray(np.zeros((3, 100)), dims=("x", "time"), attrs={"units": "mm/d"})
+    if use_dask:
+        da = da.chunk({"x": 1})
+    np.random.seed(42)
+    out1 = uniform_noise_like(da)
+    np.random.seed(42)
+    out2 = uniform_noise_like(da)
+    np.testing.assert_array_equal(out1, out2)
+    assert not (uniform_noise_like(da) == out1).all()
+
+
 @pytest.mark.parametrize("use_dask", [True, False])
 def test_adapt_freq(use_dask, random):
     time = pd.date_range("1990-01-01", "2020-12-31", freq="D")
@@ -225,6 +256,10 @@ def test_escore():
     assert "escore(" in out.attrs["history"]
     assert out.attrs["references"].startswith("Székely")
 
+    avg, std = x.mean("time"), x.std("time", ddof=1)
+    out = escore(x, y, scale=True)
+    np.testing.assert_allclose(out, escore((x - avg) / std, (y - avg) / std))
+
 
 def test_standardize(random):
     x = random.standard_normal((2, 10000))
@@ -245,6 +280,24 @@ def test_standardize(random):
     assert avg.units == xp.units
 
 
+def test_standardize_partial_overlap(random):
+    x = xr.DataArray(
+        random.standard_normal((4, 100)),
+        dims=("x", "time"),
+        coords={"x": np.arange(4)},
+        attrs={"units": "m"},
+    )
+    mean = x.mean("time").isel(x=slice(0, 2))
+
+    xp, _, std = standardize(x, mean=mean)
+    np.testing.assert_array_equal(xp.x, [0, 1])
+    np.testing.assert_allclose(xp, ((x - mean) / std).transpose(*xp.dims))
+
+    y = unstandardize(xp, mean, std.isel(x=slice(1, None)))
+    np.testing.assert_array_equal(y.x, [1])
+    np.testing.assert_allclose(y, x.sel(x=[1]).transpose(*y.dims))
+
+
 def test_reordering():
     y = xr.DataArray(np.arange(1, 11), dims=("time",), attrs={"a": 1, "units": "K"})
     x = xr.DataArray(np.arange(10, 20)[::-1], dims=("time",))
@@ -371,6 +424,19 @@ def test_to_additive_clipping_float32(timeseries):
     assert np.isfinite(hurslogit).all()
 
 
+@pytest.mark.parametrize("use_dask", [True, False])
+def test_to_additive_clipping_strict(timeseries, use_dask):
+    hurs = timeseries(np.array([-1, 0, 100, 101.0]), units="%")
+    if use_dask:
+        hurs = hurs.chunk(time=2)
+    with pytest.raises(ValueError, match="outside of the range"):
+        to_additive_space(hurs, lower_bound="0 %", trans="logit", upper_bound="100 %", clip_next_to_bounds="strict").load()
+
+    hurslogit = to_additive_space(hurs.clip(0, 100), lower_bound="0 %", trans="logit", upper_bound="100 %", clip_next_to_bounds="strict")
+    assert uses_dask(hurslogit) is use_dask
+    assert np.isfinite(hurslogit).all()
+
+
 def test_from_additive(timeseries):
     # log
     pr = timeseries(np.array([0, 1e-5, 1, np.e**10]), units="mm/d")
@@ -417,6 +483,38 @@ def test_normalize(timeseries, random):
     np.testing.assert_allclose(xp, xp2)
 
 
+@map_groups(reduces=[Grouper.DIM, Grouper.PROP], data=[Grouper.DIM], norm=[Grouper.PROP])
+def _normalize_groupwise(ds, *, dim, kind="+"):
+    # Reference implementation, with the mean and correction computed group by group.
+    norm = ds.data.mean(dim=dim)
+    data = apply_correction(ds.data, invert(norm, kind), kind)
+    return xr.Dataset({"data": data, "norm": norm.assign_attrs(_group_apply_reshape=True)})
+
+
+@pytest.mark.parametrize(
+    "group",
+    [Grouper("time.dayofyear", window=31), Grouper("time.month", add_dims=["x"])],
+)
+@pytest.mark.parametrize("kind", ["+", "*"])
+@pytest.mark.parametrize("use_dask", [True, False])
+def test_normalize_groupwise(random, group, kind, use_dask):
+    time = pd.date_range("2000-01-01", periods=365 * 4, freq="D")
+    data = xr.DataArray(
+        random.standard_normal((time.size, 3)) + 10,
+        dims=("time", "x"),
+        coords={"time": time},
+    )
+    if use_dask:
+        # The main and additional dimensions must not be chunked
+        data = data.chunk({"x": 1} if "x" not in group.add_dims else {})
+    ds = xr.Dataset({"data": data})
+
+    out = _normalize(ds, group=group, kind=kind)
+    exp = _normalize_groupwise(ds, group=group, kind=kind)
+    np.testing.assert_allclose(out.norm.transpose(*exp.norm.dims), exp.norm)
+    np.testing.assert_allclose(out.data.transpose(*exp.data.dims), exp.data)
+
+
 def test_stack_variables(gosset):
     ds1 = xr.open_dataset(gosset.fetch("sdba/CanESM2_1950-2100.nc"))
     ds2 = xr.open_dataset(gosset.fetch("sdba/ahccd_1950-2013.nc"))
@@ -548,6 +646,57 @@ class TestSpectralUtils:
         )
         assert ((0 * tx).values == tx_filt.values).all()
 
+    def test_spectral_filter_dataset(self):
+        rng = np.random.default_rng(0)
+        ds = xr.Dataset(
+            {v: (("lat", "lon"), rng.random((10, 12)), {"units": "K"}) for v in ["tasmax", "tasmin"]},
+            coords={"lat": np.linspace(50, 47, 10), "lon": np.linspace(-80, -74, 12)},
+        )
+        kws = dict(dims=["lon", "lat"], lam_long=None, lam_short=None, delta=None, alpha_low_high=[0.1, 0.5])
+        ds_filt = spectral_filter(ds, **kws)
+        for v in ds.data_vars:
+            xr.testing.assert_identical(ds_filt[v], spectral_filter(ds[v], **kws))
+
+    def test_spectral_filter_float32(self):
+        rng = np.random.default_rng(0)
+        da = xr.DataArray(rng.random((10, 12)), dims=("lat", "lon"))
+        kws = dict(dims=["lon", "lat"], lam_long=None, lam_short=None, delta=None, alpha_low_high=[0.1, 0.5])
+        filt32 = spectral_filter(da.astype(np.float32), **kws)
+        assert filt32.dtype == np.float32
+        np.testing.assert_allclose(filt32, spectral_filter(da, **kws), rtol=1e-5)
+
+    @pytest.mark.parametrize("use_dask", [True, False])
+    def test_spectral_filter_low_pass(self, use_dask):
+        # DCT-II basis functions with normalized wavenumbers 2/64 and 40/64
+        n = 64
+        x = np.arange(n)
+        low = np.cos(np.pi * 2 * (2 * x + 1) / (2 * n))
+        high = np.cos(np.pi * 40 * (2 * x + 1) / (2 * n))
+        da = xr.DataArray(np.stack([low + high, 2 * low - high]), dims=("time", "lon"))
+        if use_dask:
+            da = da.chunk(time=1)
+        filt = spectral_filter(da, dims=["lon"], lam_long=None, lam_short=None, delta=None, alpha_low_high=[0.1, 0.2])
+        np.testing.assert_allclose(filt, np.stack([low, 2 * low]), atol=1e-12)
+
+    @pytest.mark.parametrize("value", [0, 1])
+    def test_spectral_filter_trivial_mask(self, value):
+        rng = np.random.default_rng(0)
+        da = xr.DataArray(rng.random((3, 10, 12)).astype(np.float32), dims=("time", "lat", "lon"))
+        da[1, 2, 3] = np.nan
+        filt = spectral_filter(
+            da,
+            dims=["lon", "lat"],
+            lam_long=None,
+            lam_short=None,
+            delta=None,
+            alpha_low_high=[0.9, 0.99],  # dummy value
+            mask_func=lambda da, _1, _2: 0 * da + value,
+        )
+        assert filt.dtype == np.float32
+        # Slices with NaNs are all NaN, as with any other filter
+        assert filt[1].isnull().all()
+        np.testing.assert_array_equal(filt[[0, 2]], value * da[[0, 2]])
+
     def test_normalized_radial_wavenumber(self, gosset):
         ds = xr.open_dataset(
             gosset.fetch("NRCANdaily/nrcan_canada_daily_tasmax_1990.nc"),
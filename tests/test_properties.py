@@ -4,6 +4,7 @@ import numpy as np
 import pandas as pd
 import pytest
 import xarray as xr
+from scipy import stats
 from xarray import set_options
 
 from xsdba import properties
@@ -15,6 +16,17 @@ def use_dask(request):
     return request.param
 
 
+def _daily_series(random, *, nx=3, years=4, units="K"):
+    """Random daily series over a (x, time) grid."""
+    time = pd.date_range("2000-01-01", periods=365 * years, freq="D")
+    return xr.DataArray(
+        random.standard_normal((nx, time.size)) + 10,
+        dims=("x", "time"),
+        coords={"x": np.arange(nx), "time": time},
+        attrs={"units": units},
+    )
+
+
 class TestProperties:
     def test_mean(self, gosset, use_dask):
         sim = (
@@ -101,6 +113,23 @@ class TestProperties:
         assert out_season.long_name.startswith("Skewness")
         assert out_season.units == ""
 
+    @pytest.mark.parametrize("group", ["time", "time.season"])
+    def test_skewness_reference(self, random, use_dask, group):
+        da = _daily_series(random)
+        da[1, 10] = np.nan
+        if use_dask:
+            da = da.chunk(x=1, time=365)
+
+        out = properties.skewness(da, group=group)
+        if group == "time":
+            np.testing.assert_allclose(out.transpose("x").values, stats.skew(da.values, axis=-1))
+        else:
+            for season in ["DJF", "MAM", "JJA", "SON"]:
+                exp = stats.skew(da.sel(time=da.time.dt.season == season).values, axis=-1)
+                np.testing.assert_allclose(out.sel(season=season).transpose("x").values, exp)
+        # NaNs propagate, as with scipy
+        assert out.isnull().any()
+
     def test_quantile(self, gosset, use_dask):
         sim = (
             xr.open_dataset(gosset.fetch("sdba/CanESM2_1950-2100.nc"), engine="h5netcdf", chunks={})
@@ -125,6 +154,18 @@ class TestProperties:
         )
         assert out_season.long_name.startswith("Quantile 0.2")
 
+    @pytest.mark.parametrize("group", ["time.month", "time.season"])
+    def test_quantile_reference(self, random, use_dask, group):
+        da = _daily_series(random)
+        da[1, 10:20] = np.nan
+        exp = da.groupby(group).quantile(0.2, dim="time").drop_vars("quantile")
+        if use_dask:
+            # Chunked along the main dimension
+            da = da.chunk(x=1, time=365)
+
+        out = properties.quantile(da, q=0.2, group=group)
+        np.testing.assert_allclose(out.transpose(*exp.dims), exp)
+
     def test_spell_length_distribution(self, gosset, use_dask):
         ds = xr.open_dataset(gosset.fetch("sdba/CanESM2_1950-2100.nc"), engine="h5netcdf", chunks={}).sel(
             time=slice("1950", "1952"), location="Vancouver"
@@ -172,6 +213,33 @@ class TestProperties:
         assert out_sum == 365
         assert out_mixed == 182.5
 
+    def test_spell_length_distribution_transient_nan(self, use_dask):
+        # The mask is taken on the first time step of each group, so NaNs starting a group mask it
+        time = pd.date_range("2000-01-01", periods=3 * 365, freq="D")
+        tas = xr.DataArray(
+            np.resize([0.0] * 5 + [40.0] * 5, (2, time.size)),
+            dims=("x", "time"),
+            coords={"time": time},
+            attrs={"units": "degC"},
+        )
+        tas[0, 31:51] = np.nan  # 1-20 Feb 2000
+        if use_dask:
+            tas = tas.chunk(x=1)
+
+        out = properties.spell_length_distribution(tas, thresh="30 degC", op=">=", group="time.month")
+        assert out.sel(x=0, month=2).isnull()
+        assert out.sel(x=0).drop_sel(month=2).notnull().all()
+        assert out.sel(x=1).notnull().all()
+
+        with set_options(keep_attrs=True):
+            tn = tas - 5
+        out = properties.bivariate_spell_length_distribution(
+            da1=tas, da2=tn, thresh1="30 degC", thresh2="0 degC", op1=">=", op2=">", group="time.month"
+        )
+        assert out.sel(x=0, month=2).isnull()
+        assert out.sel(x=0).drop_sel(month=2).notnull().all()
+        assert out.sel(x=1).notnull().all()
+
     @pytest.mark.parametrize(
         "window,expected_amount,expected_quantile",
         [
@@ -241,6 +309,20 @@ class TestProperties:
         assert out.long_name.startswith("Lag-1 autocorrelation")
         assert out.units == ""
 
+    def test_acf_reference(self, random, use_dask):
+        sm = pytest.importorskip("statsmodels.tsa.stattools")
+        da = _daily_series(random)
+        da[1, 5] = np.nan
+        if use_dask:
+            da = da.chunk(x=1)
+
+        out = properties.acf(da, lag=2, group="time.month")
+        for month in [1, 7]:
+            for x in range(da.x.size):
+                # The mean over the years skips the NaN periods
+                exp = np.nanmean([sm.acf(per.values, nlags=2)[2] for _, per in da.isel(x=x).resample(time="MS") if per.time.dt.month[0] == month])
+                np.testing.assert_allclose(out.sel(month=month, x=x).values, exp)
+
     def test_annual_cycle(self, gosset, use_dask):
         simt = (
             xr.open_dataset(gosset.fetch("sdba/CanESM2_1950-2100.nc"), engine="h5netcdf", chunks={})
@@ -278,6 +360,27 @@ class TestProperties:
         assert relamp.units == "%"
         assert phase.units == ""
 
+    @pytest.mark.parametrize("window", [4, 31])
+    def test_annual_cycle_reference(self, random, use_dask, window):
+        da = _daily_series(random)
+        da[1, (da.time.dt.dayofyear == 50).values] = np.nan
+        if use_dask:
+            da = da.chunk(x=1)
+
+        # Circular smoothing by padding the climatology, as done before
+        ac = da.groupby("time.dayofyear").mean()
+        ac = (
+            ac.pad(dayofyear=window // 2, mode="wrap")
+            .rolling(dayofyear=window, center=True)
+            .mean()
+            .isel(dayofyear=slice(window // 2, -(window // 2)))
+        )
+
+        amp = properties.annual_cycle_amplitude(da, window=window)
+        phase = properties.annual_cycle_phase(da, window=window)
+        np.testing.assert_allclose(amp.transpose("x"), (ac.max("dayofyear") - ac.min("dayofyear")).transpose("x"))
+        np.testing.assert_array_equal(phase.transpose("x"), ac.idxmax("dayofyear").transpose("x"))
+
     def test_annual_range(self, gosset, use_dask):
         simt = (
             xr.open_dataset(gosset.fetch("sdba/CanESM2_1950-2100.nc"), engine="h5netcdf", chunks={})
@@ -324,6 +427,19 @@ class TestProperties:
         assert relamp.units == "%"
         assert phase.units == ""
 
+    def test_mean_annual_phase_reference(self, random, use_dask):
+        da = _daily_series(random)
+        da[1, 100:130] = np.nan
+        if use_dask:
+            da = da.chunk(x=1)
+
+        out = properties.mean_annual_phase(da, window=5)
+        for x in range(da.x.size):
+            # Inputs with other dimensions than time were not supported by this implementation
+            smoothed = da.isel(x=x).rolling(time=5, center=True).mean()
+            exp = smoothed.resample(time="YS").map(xr.DataArray.idxmax).dt.dayofyear.mean("time")
+            np.testing.assert_allclose(out.sel(x=x).values, exp.values)
+
     def test_corr_btw_var(self, gosset, use_dask):
         simt = (
             xr.open_dataset(gosset.fetch("sdba/CanESM2_1950-2100.nc"), engine="h5netcdf", chunks={})
@@ -363,6 +479,30 @@ class TestProperties:
         ):
             properties.corr_btw_var(sim, simt, group="time", corr_type="pear")
 
+    @pytest.mark.parametrize("corr_type", ["Pearson", "Spearman"])
+    @pytest.mark.parametrize("output", ["correlation", "pvalue"])
+    def test_corr_btw_var_reference(self, random, use_dask, corr_type, output):
+        da1 = _daily_series(random)
+        da2 = da1 * 0.5 + _daily_series(random)
+        da2.attrs["units"] = "K"
+        da1[1, :40] = np.nan
+        da2[1, 20:60] = np.nan
+        da1[2] = np.nan  # A point in the water
+        if use_dask:
+            da1, da2 = da1.chunk(x=1, time=365), da2.chunk(x=1, time=365)
+
+        out = properties.corr_btw_var(da1, da2, corr_type=corr_type, group="time.month", output=output)
+        func = stats.pearsonr if corr_type == "Pearson" else stats.spearmanr
+        index = {"correlation": 0, "pvalue": 1}[output]
+        for month in [1, 2, 6]:
+            a = da1.sel(time=da1.time.dt.month == month).values
+            b = da2.sel(time=da2.time.dt.month == month).values
+            for x in range(2):
+                ok = ~(np.isnan(a[x]) | np.isnan(b[x]))
+                exp = func(a[x][ok], b[x][ok])[index]
+                np.testing.assert_allclose(out.sel(month=month, x=x).values, exp, rtol=1e-6)
+            assert out.sel(month=month, x=2).isnull()
+
     def test_relative_frequency(self, gosset, use_dask):
         sim = (
             xr.open_dataset(gosset.fetch("sdba/CanESM2_1950-2100.nc"), engine="h5netcdf", chunks={})
@@ -378,6 +518,22 @@ class TestProperties:
         assert test.long_name == "Relative frequency of values >= 2.8925e-04 kg/m^2/s."
         assert test.units == ""
 
+    @pytest.mark.parametrize("group", ["time", "time.season"])
+    def test_relative_frequency_reference(self, random, use_dask, group):
+        da = _daily_series(random)
+        da[1, 20:30] = np.nan
+        da[2, 0] = np.nan  # A point in the water
+        if use_dask:
+            da = da.chunk(x=1)
+
+        # Inputs with other dimensions than time were not supported with a group
+        out = properties.relative_frequency(da, thresh="10.5 K", op=">=", group=group)
+        for x in range(2):
+            cond = da.isel(x=x) >= 10.5
+            exp = cond.mean("time") if group == "time" else cond.groupby(group).mean("time")
+            np.testing.assert_allclose(out.sel(x=x), exp)
+        assert out.sel(x=2).isnull().all()
+
     def test_transition(self, gosset, use_dask):
         sim = (
             xr.open_dataset(gosset.fetch("sdba/CanESM2_1950-2100.nc"), engine="h5netcdf", chunks={})
@@ -445,6 +601,27 @@ class TestProperties:
         assert slope.long_name.startswith("Slope of the interannual linear trend")
         assert slope.units == "K/year"
 
+    @pytest.mark.parametrize("group", ["time", "time.month"])
+    @pytest.mark.parametrize("output", ["slope", "intercept", "rvalue", "pvalue", "stderr", "intercept_stderr"])
+    def test_trend_reference(self, random, use_dask, group, output):
+        da = _daily_series(random, years=6)
+        da[1, :31] = np.nan  # January 2000, its mean is NaN
+        if use_dask:
+            da = da.chunk(x=1)
+
+        out = properties.trend(da, group=group, output=output)
+        if group == "time":
+            means = {None: da.resample(time="YS").mean()}
+        else:
+            monthly = da.resample(time="MS").mean()
+            means = {m: monthly.sel(time=monthly.time.dt.month == m) for m in [1, 7]}
+        for month, mean in means.items():
+            for x in range(da.x.size):
+                res = out.sel(x=x) if month is None else out.sel(x=x, month=month)
+                y = mean.isel(x=x).values
+                exp = getattr(stats.linregress(np.arange(y.size), y), output)
+                np.testing.assert_allclose(res.values, exp, rtol=1e-6)
+
     def test_return_value(self, gosset, use_dask):
         simt = (
             xr.open_dataset(gosset.fetch("sdba/CanESM2_1950-2100.nc"), engine="h5netcdf", chunks={})
@@ -462,6 +639,41 @@ class TestProperties:
         assert out_y.long_name.startswith("20-year maximal return level")
 
     @pytest.mark.slow
+    @pytest.mark.parametrize("ndims", [1, 2])
+    def test_bin_correlations_reference(self, random, ndims):
+        corr = random.uniform(-1, 1, (3, 10, 10))
+        corr[0, 2, :5] = np.nan
+        corr[1] = np.nan
+        distance = random.uniform(-10, 110, (10, 10))
+        distance[0, 0] = 100  # on the last edge
+        distance[1, 1] = np.nan
+        edges = np.linspace(0, 100, 11)
+
+        out = properties._bin_correlations(corr, distance, edges, ndims=ndims)
+        if ndims == 1:
+            corr, distance = corr.reshape(30, 10), np.tile(distance, (3, 1))
+        else:
+            corr, distance = corr.reshape(3, 100), np.tile(distance.ravel(), (3, 1))
+        exp = []
+        for c, d in zip(corr, distance, strict=True):
+            ok = ~(np.isnan(c) | np.isnan(d))
+            if ok.any():
+                exp.append(stats.binned_statistic(d[ok], c[ok], statistic="mean", bins=edges).statistic)
+            else:
+                exp.append(np.full(edges.size - 1, np.nan))
+        np.testing.assert_allclose(out.reshape(-1, edges.size - 1), np.array(exp))
+
+    def test_bin_correlations_nan_corr(self, random):
+        # Pairs with a NaN correlation are ignored, their distances need not be masked
+        corr = random.uniform(-1, 1, (10, 10))
+        corr[np.tril_indices(10)] = np.nan
+        distance = random.uniform(0, 100, (10, 10))
+        edges = np.linspace(0, 100, 11)
+
+        out = properties._bin_correlations(corr, distance, edges, ndims=2)
+        exp = properties._bin_correlations(corr, np.where(np.isnan(corr), np.nan, distance), edges, ndims=2)
+        np.testing.assert_array_equal(out, exp)
+
     def test_spatial_correlogram(self, gosset, use_dask):
         # This also tests sdba.utils._pairwise_spearman and sdba.nbutils._pairwise_haversine_and_bins
         # Test 1, does it work with 1D data?
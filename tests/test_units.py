@@ -4,7 +4,23 @@ import numpy as np
 import pytest
 import xarray as xr
 
-from xsdba.units import harmonize_units, str2pint, units, units2pint
+import xsdba.units
+from xsdba.units import (
+    _cf_format,
+    _format_units,
+    _multiply_factor_cached,
+    _parse_units,
+    convert_units_to,
+    harmonize_units,
+    normalized_wavenumber_to_wavelength,
+    pint2cfattrs,
+    pint_multiply,
+    str2pint,
+    units,
+    units2pint,
+    units2str,
+    wavelength_to_normalized_wavenumber,
+)
 
 
 class TestUnits:
@@ -26,6 +42,27 @@ class TestConvertUnitsTo:
     def test_temperature_aliases(self, alias):
         assert alias == units("celsius")
 
+    def test_same_units(self):
+        da = xr.DataArray([0.0, 10.0], attrs={"units": "degC"})
+        # Units written the same way are returned without conversion
+        assert convert_units_to(da, "degC") is da
+        assert convert_units_to(da, da.copy()) is da
+        np.testing.assert_allclose(convert_units_to(da, "K"), [273.15, 283.15])
+
+    def test_same_units_different_metadata(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr(xsdba.units, "units2str", lambda value: calls.append(value) or units2str(value))
+        delta = xr.DataArray([0.0, 10.0], attrs={"units": "K", "units_metadata": "temperature: difference"})
+
+        # The same units and metadata take the fast path, without formatting the units
+        assert convert_units_to(delta, delta.copy()) is delta
+        assert calls == []
+
+        # A temperature and a temperature difference written the same way are compared as units
+        target = xr.DataArray([0.0], attrs={"units": "K", "units_metadata": "temperature: on_scale"})
+        np.testing.assert_allclose(convert_units_to(delta, target), [0, 10])
+        assert len(calls) == 2
+
 
 class TestUnitConversion:
     def test_pint2str(self):
@@ -48,6 +85,27 @@ class TestUnitConversion:
         u = units2pint("1")
         assert str(u) == "1"
 
+    def test_units2pint_cached(self):
+        da = xr.DataArray([1, 2], attrs={"units": "mm/d"})
+        _parse_units.cache_clear()
+        assert units2pint(da) == units2pint("mm/d") == units.mm / units.d
+        assert _parse_units.cache_info().hits == 1
+        # Parsing errors are not cached
+        for _ in range(2):
+            with pytest.raises(ValueError, match="Remove white space"):
+                units2pint("deg C")
+        # The metadata is part of the key
+        assert units2pint({"units": "degC", "units_metadata": "temperature: difference"}) == units.delta_degC
+        assert units2pint({"units": "degC"}) == units.degC
+
+    def test_units2str_cached(self):
+        da = xr.DataArray([1, 2], attrs={"units": "mm/d"})
+        _format_units.cache_clear()
+        assert units2str(da) == units2str("mm/d") == units2str(units.mm / units.d) == "mm d-1"
+        assert _format_units.cache_info().hits == 1
+        # A string with a magnitude is formatted without it
+        assert units2str("2 mm/d") == "mm d-1"
+
     def test_str2pint(self):
         Q_ = units.Quantity
         assert str2pint("-0.78 m") == Q_(-0.78, units="meter")
@@ -55,6 +113,42 @@ class TestUnitConversion:
         assert str2pint("11.8 degC days") == Q_(11.8, units="delta_degree_Celsius days")
         assert str2pint("nan m^2 K^-3").units == Q_(1, units="m²/K³").units
 
+    def test_pint2cfattrs(self):
+        _cf_format.cache_clear()
+        attrs = pint2cfattrs(units.K, is_difference=True)
+        assert attrs == {"units": "K", "units_metadata": "temperature: difference"}
+        # The formatting is cached, not the returned attributes
+        attrs["units"] = "degC"
+        assert pint2cfattrs(units.K, is_difference=True)["units"] == "K"
+        assert pint2cfattrs(1 * units.K) == {"units": "K", "units_metadata": "temperature: unknown"}
+        assert _cf_format.cache_info().hits == 2
+        assert pint2cfattrs(units.mm / units.d) == {"units": "mm d-1"}
+
+    def test_pint_multiply(self):
+        da = xr.DataArray([1.0, 2.0], attrs={"units": "mm/d"})
+        _multiply_factor_cached.cache_clear()
+        for _ in range(2):
+            out = pint_multiply(da, "2 d")
+            np.testing.assert_allclose(out, [2, 4])
+            assert out.units == "mm"
+        assert _multiply_factor_cached.cache_info().hits == 1
+        # Quantities are not cached, their magnitude can be an array
+        out = pint_multiply(da, units.Quantity(np.array(2.0), "d"), out_units="cm")
+        np.testing.assert_allclose(out, [0.2, 0.4])
+        assert out.units == "cm"
+        assert _multiply_factor_cached.cache_info().currsize == 1
+
+    def test_integer_magnitudes(self):
+        q = str2pint("3 km")
+        assert q.m == 3
+        assert str2pint(f"{q.m} {q.units}") == q
+        assert convert_units_to("3 km", "m") == 3000
+        # Wavelengths given as strings round-trip through normalized wavenumbers
+        lam = normalized_wavenumber_to_wavelength(0.5, delta="10 km")
+        assert lam == "40.0 km"
+        assert wavelength_to_normalized_wavenumber(lam, delta="10 km") == 0.5
+        assert wavelength_to_normalized_wavenumber("40 km", delta="10000 m") == 0.5
+
 
 class TestHarmonizeUnits:
     def test_simple(self):
@@ -77,6 +171,32 @@ class TestHarmonizeUnits:
 
         assert gt(da, thr) == 1
 
+    def test_defaults_keywords_positional(self):
+        da = xr.DataArray([273.15, 274.15], attrs={"units": "K"})
+
+        @harmonize_units(["d", "t"])
+        def thresh(d, t="0 degC"):
+            return t
+
+        # The default value is converted too
+        assert thresh(da) == pytest.approx(273.15)
+        assert thresh(da, "1 degC") == pytest.approx(274.15)
+        assert thresh(da, t="1 degC") == pytest.approx(274.15)
+        assert thresh(d=da, t="1 degC") == pytest.approx(274.15)
+
+    def test_other_arguments(self):
+        da = xr.DataArray([273.15, 274.15], attrs={"units": "K"})
+
+        @harmonize_units(["d", "t", "u"])
+        def func(x, d, *args, t, u=None, scale=2, **kwargs):
+            return x, d, args, t, u, scale, kwargs
+
+        x, d, args, t, u, scale, kwargs = func("x", da, 1, 2, t="1 degC", scale=3, other=4)
+        # The arguments that are not checked are passed on untouched, and None is ignored
+        assert (x, args, u, scale, kwargs) == ("x", (1, 2), None, 3, {"other": 4})
+        assert d is da
+        assert t == pytest.approx(274.15)
+
     def test_wrong_decorator(self):
         da = xr.DataArray([1, 2], attrs={"units": "K"})
         thr = "1 K"